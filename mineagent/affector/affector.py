@@ -39,25 +39,15 @@ class LinearAffector(nn.Module):
 
         self.num_keys = num_keys
 
-        # Binary key logits (one per key)
-        self.key_head = nn.Linear(embed_dim, num_keys)
-
-        # Mouse movement (mean + log-std for dx and dy)
-        self.mouse_dx_mean = nn.Linear(embed_dim, 1)
-        self.mouse_dx_logstd = nn.Linear(embed_dim, 1)
-        self.mouse_dy_mean = nn.Linear(embed_dim, 1)
-        self.mouse_dy_logstd = nn.Linear(embed_dim, 1)
-
-        # Mouse buttons (3 independent Bernoulli logits)
-        self.mouse_button_head = nn.Linear(embed_dim, 3)
-
-        # Scroll (mean + log-std)
-        self.scroll_mean = nn.Linear(embed_dim, 1)
-        self.scroll_logstd = nn.Linear(embed_dim, 1)
-
-        # Internal focus / region-of-interest
-        self.focus_means = nn.Linear(embed_dim, 2)
-        self.focus_logstds = nn.Linear(embed_dim, 2)
+        # All heads read the same input, so they share one linear layer whose
+        # output is split into (in order):
+        # - binary key logits (one per key)
+        # - mouse movement (mean + log-std for dx and dy)
+        # - mouse buttons (3 independent Bernoulli logits)
+        # - scroll (mean + log-std)
+        # - internal focus / region-of-interest (means + log-stds)
+        self._head_sizes = (num_keys, 1, 1, 1, 1, 3, 1, 1, 2, 2)
+        self.heads = nn.Linear(embed_dim, sum(self._head_sizes))
 
         self.softplus = nn.Softplus()
 
@@ -65,17 +55,29 @@ class LinearAffector(nn.Module):
         self.start_monitoring()
 
     def forward(self, x: torch.Tensor) -> AffectorOutput:
+        (
+            key_logits,
+            mouse_dx_mean,
+            mouse_dx_logstd,
+            mouse_dy_mean,
+            mouse_dy_logstd,
+            mouse_button_logits,
+            scroll_mean,
+            scroll_logstd,
+            focus_means,
+            focus_logstds,
+        ) = self.heads(x).split(self._head_sizes, dim=-1)
         return AffectorOutput(
-            key_logits=self.key_head(x),
-            mouse_dx_mean=self.mouse_dx_mean(x).squeeze(-1),
-            mouse_dx_std=self.softplus(self.mouse_dx_logstd(x)).squeeze(-1),
-            mouse_dy_mean=self.mouse_dy_mean(x).squeeze(-1),
-            mouse_dy_std=self.softplus(self.mouse_dy_logstd(x)).squeeze(-1),
-            mouse_button_logits=self.mouse_button_head(x),
-            scroll_mean=self.scroll_mean(x).squeeze(-1),
-            scroll_std=self.softplus(self.scroll_logstd(x)).squeeze(-1),
-            focus_means=self.focus_means(x),
-            focus_stds=self.softplus(self.focus_logstds(x)),
+            key_logits=key_logits,
+            mouse_dx_mean=mouse_dx_mean.squeeze(-1),
+            mouse_dx_std=self.softplus(mouse_dx_logstd).squeeze(-1),
+            mouse_dy_mean=mouse_dy_mean.squeeze(-1),
+            mouse_dy_std=self.softplus(mouse_dy_logstd).squeeze(-1),
+            mouse_button_logits=mouse_button_logits,
+            scroll_mean=scroll_mean.squeeze(-1),
+            scroll_std=self.softplus(scroll_logstd).squeeze(-1),
+            focus_means=focus_means,
+            focus_stds=self.softplus(focus_logstds),
         )
 
     def stop_monitoring(self):
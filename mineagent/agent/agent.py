@@ -142,7 +142,7 @@ class AgentV1:
 
         env_action_dict = self.action_tensor_to_env(env_action)
 
-        if self.monitor_actions:
+        if self.monitor_actions and self.event_bus.has_listeners(Action):
             self.event_bus.publish(
                 Action(
                     timestamp=datetime.now(),
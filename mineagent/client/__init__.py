@@ -2,6 +2,7 @@ from .connection import AsyncMinecraftClient, ConnectionConfig
 from .protocol import (
     COMMAND_TO_KEY,
     GLFW,
+    HEADER_STRUCT,
     KEY_LIST,
     KEY_TO_INDEX,
     NUM_KEYS,
@@ -9,6 +10,7 @@ from .protocol import (
     RawInput,
     action_to_raw_input,
     make_action_space,
+    pack_mouse_buttons,
     parse_observation,
     raw_input_to_action,
 )
@@ -18,6 +20,7 @@ __all__ = [
     "ConnectionConfig",
     "COMMAND_TO_KEY",
     "GLFW",
+    "HEADER_STRUCT",
     "KEY_LIST",
     "KEY_TO_INDEX",
     "NUM_KEYS",
@@ -25,6 +28,7 @@ __all__ = [
     "RawInput",
     "action_to_raw_input",
     "make_action_space",
+    "pack_mouse_buttons",
     "parse_observation",
     "raw_input_to_action",
 ]
@@ -215,8 +215,16 @@ NUM_KEYS: int = len(KEY_LIST)
 
 KEY_TO_INDEX: dict[int, int] = {code: idx for idx, code in enumerate(KEY_LIST)}
 
+# Precompiled wire formats so per-message packing skips format-string parsing.
+# Key code (short) / mouse dx, dy, buttons, scroll, text length
+_KEY_CODE_STRUCT = struct.Struct(">h")
+_INPUT_TAIL_STRUCT = struct.Struct(">ffBfH")
 
-@dataclass
+# Observation header: reward (double) + frame length (uint32)
+HEADER_STRUCT = struct.Struct(">dI")
+
+
+@dataclass(slots=True)
 class RawInput:
     """
     Raw input data to send to Minecraft.
@@ -241,29 +249,26 @@ class RawInput:
 
     def to_bytes(self) -> bytes:
         """Serialize to binary protocol format."""
-        data = bytearray()
-
         num_keys = len(self.key_codes)
         if num_keys > 255:
             raise ValueError(f"Too many keys pressed: {num_keys} (max 255)")
-        data.append(num_keys)
-
-        for key_code in self.key_codes:
-            data.extend(struct.pack(">h", key_code))
-
-        data.extend(struct.pack(">f", self.mouse_dx))
-        data.extend(struct.pack(">f", self.mouse_dy))
-
-        data.append(self.mouse_buttons & 0xFF)
-
-        data.extend(struct.pack(">f", self.scroll_delta))
 
         text_bytes = self.text.encode("utf-8")
         text_length = len(text_bytes)
         if text_length > 65535:
             raise ValueError(f"Text too long: {text_length} bytes (max 65535)")
-        data.extend(struct.pack(">H", text_length))
-        data.extend(text_bytes)
+
+        data = bytearray((num_keys,))
+        for key_code in self.key_codes:
+            data += _KEY_CODE_STRUCT.pack(key_code)
+        data += _INPUT_TAIL_STRUCT.pack(
+            self.mouse_dx,
+            self.mouse_dy,
+            self.mouse_buttons & 0xFF,
+            self.scroll_delta,
+            text_length,
+        )
+        data += text_bytes
 
         return bytes(data)
 
@@ -322,8 +327,7 @@ def parse_observation(
     if len(header) != 12:
         raise ValueError(f"Header must be 12 bytes, got {len(header)}")
 
-    reward = struct.unpack(">d", header[0:8])[0]
-    frame_length = struct.unpack(">I", header[8:12])[0]
+    reward, frame_length = HEADER_STRUCT.unpack(header)
 
     if frame_length != len(frame_data):
         raise ValueError(
@@ -349,6 +353,26 @@ MOUSE_DX_RANGE = (-180.0, 180.0)
 MOUSE_DY_RANGE = (-180.0, 180.0)
 SCROLL_RANGE = (-10.0, 10.0)
 
+_KEY_CODES = np.asarray(KEY_LIST, dtype=np.int64)
+_MOUSE_BUTTON_WEIGHTS = 1 << np.arange(3)
+
+
+def pack_mouse_buttons(mouse_buttons: np.ndarray) -> np.ndarray:
+    """
+    Pack MultiBinary(3) mouse button vectors into RawInput button bitmasks.
+
+    Parameters
+    ----------
+    mouse_buttons : np.ndarray
+        Array of shape (..., 3); nonzero entries mean pressed (left, right, middle)
+
+    Returns
+    -------
+    np.ndarray
+        Integer bitmasks of shape (...), bit i set when button i is pressed
+    """
+    return (np.asarray(mouse_buttons) != 0) @ _MOUSE_BUTTON_WEIGHTS
+
 
 def make_action_space():
     """Build the Gymnasium Dict action space that mirrors RawInput."""
@@ -379,20 +403,16 @@ def action_to_raw_input(action: dict[str, np.ndarray]) -> RawInput:
     RawInput
         Ready to serialize with ``to_bytes()`` and send to the Forge mod.
     """
-    keys_vec = np.asarray(action["keys"], dtype=np.int8).ravel()
-    key_codes = [KEY_LIST[i] for i, pressed in enumerate(keys_vec) if pressed]
+    keys_vec = np.asarray(action["keys"]).ravel()
+    key_codes = _KEY_CODES[keys_vec != 0].tolist()
 
-    mouse_buttons_vec = np.asarray(action["mouse_buttons"], dtype=np.int8).ravel()
-    mouse_buttons = 0
-    for bit, pressed in enumerate(mouse_buttons_vec):
-        if pressed:
-            mouse_buttons |= 1 << bit
+    mouse_buttons_vec = np.asarray(action["mouse_buttons"]).ravel()
 
     return RawInput(
         key_codes=key_codes,
         mouse_dx=float(action["mouse_dx"]),
         mouse_dy=float(action["mouse_dy"]),
-        mouse_buttons=mouse_buttons,
+        mouse_buttons=int(pack_mouse_buttons(mouse_buttons_vec)),
         scroll_delta=float(action["scroll_delta"]),
     )
 
@@ -419,10 +439,9 @@ def raw_input_to_action(raw_input: RawInput) -> dict[str, np.ndarray]:
         if idx is not None:
             keys[idx] = 1
 
-    mouse_buttons = np.zeros(3, dtype=np.int8)
-    for bit in range(3):
-        if raw_input.mouse_buttons & (1 << bit):
-            mouse_buttons[bit] = 1
+    mouse_buttons = ((raw_input.mouse_buttons & _MOUSE_BUTTON_WEIGHTS) != 0).astype(
+        np.int8
+    )
 
     return {
         "keys": keys,
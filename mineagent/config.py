@@ -1,13 +1,22 @@
-from collections.abc import Iterable
-from dataclasses import dataclass, is_dataclass, field
+from collections.abc import Callable
+from dataclasses import dataclass, fields, is_dataclass, field, replace
 import argparse
-from typing import Any
+import functools
+import os
+import types
+from pathlib import Path
+from typing import Any, Union, get_args, get_origin, get_type_hints
 
 import yaml
 from dacite import from_dict
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EngineConfig:
     """
     Configuration definition for the Engine running the Minecraft experience loop
@@ -24,7 +33,7 @@ class EngineConfig:
     max_steps: int = 10_000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PPOConfig:
     """
     Configuration definition for the PPO learning algorithm
@@ -68,14 +77,14 @@ class PPOConfig:
     intrinsic_reward_coeff: float = 1.0
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TDConfig:
     """Configuration definition for the Temporal Difference Actor Critic learning algorithm"""
 
     discount_factor: float = 0.99
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ICMConfig:
     """
     Configuration definition for the ICM learning algorithm
@@ -98,7 +107,7 @@ class ICMConfig:
     forward_dynamics_lr: float = 1.0e-3
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
     """
     Configuration definitions for the agent
@@ -120,7 +129,7 @@ class AgentConfig:
     roi_shape: tuple[int, int] = (32, 32)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TensorboardConfig:
     """
     Configuration for TensorBoard logging
@@ -131,13 +140,16 @@ class TensorboardConfig:
         Directory to save TensorBoard logs
     flush_secs : int, optional
         How often to flush data to disk (in seconds)
+    histogram_max_elements : int, optional
+        Tensors with more elements are sub-sampled with a fixed stride before being logged as histograms
     """
 
     log_dir: str = "runs"
     flush_secs: int = 10
+    histogram_max_elements: int = 8192
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EventLoggingConfig:
     """
     Configuration for event logging
@@ -151,7 +163,7 @@ class EventLoggingConfig:
     module_step_frequency: int = 10
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class MonitoringConfig:
     """
     Configuration for the monitoring system
@@ -174,7 +186,7 @@ class MonitoringConfig:
     # checkpoint_frequency: int = 1000
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Config:
     """
     Configuration definitions for the full program
@@ -201,7 +213,7 @@ def get_config() -> Config:
     else:
         config = Config()
     if arguments.key_value_pairs is not None:
-        update_config(config, arguments.key_value_pairs)
+        config = update_config(config, arguments.key_value_pairs)
     return config
 
 
@@ -232,6 +244,9 @@ def parse_config(yaml_path: str) -> Config:
     """
     Parses the configuration file used by the engine.
 
+    Parsed files are cached per process and re-read when their modification time changes.
+    The configuration is immutable, so the cached instance is shared between calls.
+
     Parameters
     ----------
     yaml_path : str
@@ -242,8 +257,15 @@ def parse_config(yaml_path: str) -> Config:
     Config
         The current configuration
     """
-    with open(yaml_path, "r") as fp:
-        config_dict = yaml.load(fp, yaml.Loader)
+    path = os.path.abspath(yaml_path)
+    return _parse_config_file(path, os.stat(path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_config_file(yaml_path: str, mtime_ns: int) -> Config:
+    """Parse `yaml_path`; `mtime_ns` is only part of the cache key."""
+    # Hand libyaml the raw bytes; it decodes them itself
+    config_dict = yaml.load(Path(yaml_path).read_bytes(), _YamlLoader)
 
     # Convert lists to tuples for fields that expect tuples
     def convert_lists_to_tuples(data_class, data):
@@ -277,43 +299,178 @@ def parse_value(value: str) -> Any:
     return yaml.load(value, Loader=yaml.SafeLoader)
 
 
-def _set_value(instance: Any, keys: list[str], value: Any) -> None:
-    for key in keys[:-1]:
-        instance = getattr(instance, key)
-        if not is_dataclass(instance):
+def _parse_bool(value: str) -> bool:
+    lowered = value.strip().lower()
+    if lowered not in ("true", "false"):
+        raise ValueError(f"Expected 'true' or 'false' but got '{value}'")
+    return lowered == "true"
+
+
+def _tuple_parser(hint: Any) -> Callable[[str], tuple]:
+    """Parser for a `tuple[...]` field written as `[a,b,...]`."""
+    item_types = get_args(hint)
+    # `tuple[T, ...]` takes any number of items of type T
+    variadic = len(item_types) == 2 and item_types[1] is Ellipsis
+
+    def parse(value: str) -> tuple:
+        value = value.strip()
+        if not (value.startswith("[") and value.endswith("]")):
+            raise ValueError(f"Expected a list like '[a,b]' but got '{value}'")
+        items = [item for item in value[1:-1].split(",") if item.strip()]
+        if variadic:
+            return tuple(_value_parser(item_types[0])(item) for item in items)
+        if len(items) != len(item_types):
             raise ValueError(
-                f"Expected attribute '{key}' to be a dataclass instance but got '{type(key)}'"
+                f"Expected {len(item_types)} values but got {len(items)} in '{value}'"
             )
+        return tuple(
+            _value_parser(item_type)(item) for item_type, item in zip(item_types, items)
+        )
 
-    attr = keys[-1]
-    value = parse_value(value)
-    old_value = getattr(instance, attr)
+    return parse
+
+
+def _value_parser(hint: Any) -> Callable[[str], Any]:
+    """Parser from a command-line string to a value of the field type `hint`."""
+    if hint is bool:
+        return _parse_bool
+    if hint in (int, float):
+        return lambda value: hint(value.strip())
+    if hint is str:
+        return str
+    if get_origin(hint) is tuple:
+        return _tuple_parser(hint)
+    return _checked_yaml_parser(hint)
+
+
+def _runtime_types(hint: Any) -> tuple[type, ...] | None:
+    """Classes a value of the field type `hint` may be an instance of, or None if unknown."""
+    origin = get_origin(hint)
+    if origin in (Union, types.UnionType):
+        runtime_types: tuple[type, ...] = ()
+        for arg in get_args(hint):
+            arg_types = _runtime_types(arg)
+            if arg_types is None:
+                return None
+            runtime_types += arg_types
+        return runtime_types
+    if origin is not None:
+        # Generic aliases such as list[int] check the container only; Literal etc. are unknown
+        return (origin,) if isinstance(origin, type) else None
+    if isinstance(hint, type):
+        return (hint,)
+    return None
+
+
+def _checked_yaml_parser(hint: Any) -> Callable[[str], Any]:
+    """YAML parser for any other field type, rejecting values that are not of type `hint`."""
+    expected = _runtime_types(hint)
+
+    def parse(value: str) -> Any:
+        parsed = parse_value(value)
+        if expected is None:
+            return parsed
+        # YAML has no tuples, and an int is accepted where a float is expected
+        if isinstance(parsed, list) and tuple in expected:
+            parsed = tuple(parsed)
+        elif type(parsed) is int and float in expected and int not in expected:
+            parsed = float(parsed)
+        if not isinstance(parsed, expected) or (
+            isinstance(parsed, bool) and bool not in expected
+        ):
+            raise ValueError(
+                f"Expected a value of type '{hint}' but got '{value}' ({type(parsed)})"
+            )
+        return parsed
 
-    # Type mismatch based on raw types or being iterables
-    if (
-        (
-            not isinstance(value, Iterable)
-            and not isinstance(old_value, Iterable)
-            and type(value) is not type(old_value)
-        )
-        or (isinstance(value, Iterable) and not isinstance(old_value, Iterable))
-        or (not isinstance(value, Iterable) and isinstance(old_value, Iterable))
-    ):
-        raise ValueError(
-            f"Expected attribute to be '{type(old_value)}' but got '{type(value)}'"
-        )
+    return parse
+
+
+def _replace_value(instance: Any, keys: tuple[str, ...], value: Any) -> Any:
+    """Copy of `instance` with the field at `keys` set to `value`, sharing untouched branches."""
+    key = keys[0]
+    if len(keys) > 1:
+        child = getattr(instance, key)
+        if not is_dataclass(child):
+            raise ValueError(
+                f"Expected attribute '{key}' to be a dataclass instance but got '{type(child)}'"
+            )
+        value = _replace_value(child, keys[1:], value)
+    return replace(instance, **{key: value})
+
+
+def _nested_dataclass(hint: Any) -> type | None:
+    """The dataclass type held by a field annotated `hint` (including `X | None`), if any."""
+    if is_dataclass(hint):
+        return hint  # type: ignore[return-value]
+    if get_origin(hint) in (Union, types.UnionType):
+        for arg in get_args(hint):
+            if is_dataclass(arg):
+                return arg  # type: ignore[return-value]
+    return None
 
-    # Need to handle special cases of tuples
-    if isinstance(old_value, tuple):
-        setattr(instance, attr, tuple(value))
-    else:
-        setattr(instance, attr, value)
+
+def _config_key_paths(
+    data_class: type, prefix: tuple[str, ...] = ()
+) -> dict[str, tuple[tuple[str, ...], Callable[[str], Any]]]:
+    """
+    Map every dotted leaf key of `data_class` (e.g. "agent.ppo.clip_ratio") to its attribute
+    names and the parser for its annotated type.
+    """
+    hints = get_type_hints(data_class)
+    paths = {}
+    for dc_field in fields(data_class):
+        keys = (*prefix, dc_field.name)
+        hint = hints[dc_field.name]
+        nested = _nested_dataclass(hint)
+        if nested is None:
+            paths[".".join(keys)] = (keys, _value_parser(hint))
+        else:
+            paths.update(_config_key_paths(nested, keys))
+    return paths
+
+
+# Resolved once from the schema so that updates are a single lookup per key
+_CONFIG_KEY_PATHS = _config_key_paths(Config)
 
 
-def update_config(config: Config, key_value_pairs: list[str]) -> None:
-    """Updates the configuration using the command-line argumments"""
+def update_config(config: Config, key_value_pairs: list[str]) -> Config:
+    """
+    Apply command-line overrides to a configuration.
 
+    Parameters
+    ----------
+    config : Config
+        Configuration to start from; it is not modified
+    key_value_pairs : list[str]
+        Overrides of the form `<dotted.key>=<value>`
+
+    Returns
+    -------
+    Config
+        New configuration with the overrides applied
+
+    Raises
+    ------
+    ValueError
+        If a key is unknown or a value does not parse as the field's type
+    """
+    # Pass 1: split every pair and resolve its key, so a malformed or unknown key is
+    # reported before any value is parsed
+    entries = []
     for pair in key_value_pairs:
-        path, value = pair.split("=", 1)
-        keys = path.split(".")
-        _set_value(config, keys, value)
+        path, separator, value = pair.partition("=")
+        entry = _CONFIG_KEY_PATHS.get(path)
+        if not separator or entry is None:
+            raise ValueError(
+                f"Expected '<key>=<value>' with a known configuration key but got '{pair}'"
+            )
+        entries.append((*entry, value))
+
+    # Pass 2: parse every value, so any invalid entry fails before anything is applied
+    updates = [(keys, parser(value)) for keys, parser, value in entries]
+
+    # Pass 3: apply the parsed values
+    for keys, parsed in updates:
+        config = _replace_value(config, keys, parsed)
+    return config
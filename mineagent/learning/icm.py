@@ -209,10 +209,10 @@ class ICM:
         self.forward_dynamics.eval()
 
     def _finalize_trajectory(self, data: TrajectoryBuffer) -> ICMSample:
-        features_buffer = list(data.features_buffer)
-        features = torch.stack(features_buffer[:-1])
-        next_features = torch.stack(features_buffer[1:])
-        actions = torch.stack(list(data.actions_buffer)[:-1])
+        features_buffer = data.features_buffer
+        features = features_buffer[:-1]
+        next_features = features_buffer[1:]
+        actions = data.actions_buffer[:-1]
         return ICMSample(features, next_features, actions)
 
     def update(self, data: TrajectoryBuffer) -> None:
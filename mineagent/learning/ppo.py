@@ -207,40 +207,38 @@ class PPO:
         """
 
         # Cannot use the last values here since we don't have the associated reward yet
-        features = torch.stack(list(data.features_buffer)[:-1])
-        actions = torch.stack(list(data.actions_buffer)[:-1])
+        features = data.features_buffer[:-1]
+        actions = data.actions_buffer[:-1]
         # Sum per-component log probs to get joint log prob per timestep
-        raw_logp = torch.stack(list(data.log_probs_buffer)[:-1])
+        raw_logp = data.log_probs_buffer[:-1]
         log_probabilities = raw_logp.sum(dim=-1) if raw_logp.dim() > 1 else raw_logp
 
         # Focus data (stored separately)
-        focus_actions = torch.stack(list(data.focus_buffer)[:-1])
-        raw_focus_logp = torch.stack(list(data.focus_logp_buffer)[:-1])
+        focus_actions = data.focus_buffer[:-1]
+        raw_focus_logp = data.focus_logp_buffer[:-1]
         focus_log_probabilities = (
             raw_focus_logp.sum(dim=-1) if raw_focus_logp.dim() > 1 else raw_focus_logp
         )
 
         # Cannot use the first reward value since we no longer have the associated feature
         # The reward for a_t is at r_{t+1}
-        env_rewards = torch.tensor(list(data.rewards_buffer)[1:])
-        intrinsic_rewards = torch.tensor(list(data.intrinsic_rewards_buffer)[1:])
+        env_rewards = data.rewards_buffer[1:]
+        intrinsic_rewards = data.intrinsic_rewards_buffer[1:]
         rewards = (
             self.extrinsic_reward_coeff * env_rewards
             + self.intrinsic_reward_coeff * intrinsic_rewards
         )
         # Need all values since the final one is used to estimate future reward
-        values = torch.tensor(list(data.values_buffer))
+        values = data.values_buffer
 
         deltas = rewards + (self.discount_factor * values[1:]) - values[:-1]
-        advantages = torch.tensor(
+        advantages = torch.from_numpy(
             discount_cumsum(
                 deltas.numpy(), self.discount_factor * self.gae_discount_factor
-            ).copy(),
-            dtype=torch.float,
+            )
         )
-        returns = torch.tensor(
-            discount_cumsum(rewards.numpy(), self.discount_factor).copy(),
-            dtype=torch.float,
+        returns = torch.from_numpy(
+            discount_cumsum(rewards.numpy(), self.discount_factor)
         ).unsqueeze(1)
 
         return PPOSample(
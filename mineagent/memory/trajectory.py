@@ -1,5 +1,3 @@
-from collections import deque
-
 import torch
 
 
@@ -17,22 +15,142 @@ class TrajectoryBuffer:
     Note: a single item is not complete enough information to learn from.
     At least two consecutive items in the trajectory are necessary for learning.
     This is because the next observation and reward are not available until the next step is stored.
+
+    Storage is preallocated as one contiguous tensor per field (structure of arrays) and used
+    as a ring buffer: once full, each store overwrites the oldest slot. Tensor fields are
+    allocated on the first store, using the shape and dtype of the tensors stored. Stored
+    tensors are copied into the buffer, so callers may reuse their input tensors. The optional
+    focus fields must be given for every store or for none, so that they stay aligned.
+    The `*_buffer` attributes return the items in chronological order (oldest first).
+
+    When `pin_memory` is set (the default whenever CUDA is available) the storage is allocated
+    in page-locked host memory once, so `to_device` can copy it to the GPU asynchronously.
     """
 
-    def __init__(self, max_buffer_size: int):
+    def __init__(
+        self, max_buffer_size: int, pin_memory: bool = torch.cuda.is_available()
+    ):
         self.max_buffer_size = max_buffer_size
+        self.pin_memory = pin_memory
 
-        self.features_buffer: deque[torch.Tensor] = deque([], maxlen=max_buffer_size)
-        self.actions_buffer: deque[torch.Tensor] = deque([], maxlen=max_buffer_size)
-        self.rewards_buffer: deque[float] = deque([], maxlen=max_buffer_size)
-        self.intrinsic_rewards_buffer: deque[float] = deque([], maxlen=max_buffer_size)
-        self.values_buffer: deque[float] = deque([], maxlen=max_buffer_size)
-        self.log_probs_buffer: deque[torch.Tensor] = deque([], maxlen=max_buffer_size)
-        self.focus_buffer: deque[torch.Tensor] = deque([], maxlen=max_buffer_size)
-        self.focus_logp_buffer: deque[torch.Tensor] = deque([], maxlen=max_buffer_size)
+        # Number of valid items and the slot the next item is written to
+        self._size = 0
+        self._next = 0
+
+        self._features: torch.Tensor | None = None
+        self._actions: torch.Tensor | None = None
+        self._log_probs: torch.Tensor | None = None
+        self._focus: torch.Tensor | None = None
+        self._focus_logp: torch.Tensor | None = None
+        self._rewards = self._allocate((max_buffer_size,), torch.float).zero_()
+        self._intrinsic_rewards = self._allocate(
+            (max_buffer_size,), torch.float
+        ).zero_()
+        self._values = self._allocate((max_buffer_size,), torch.float).zero_()
 
     def __len__(self):
-        return len(self.features_buffer)
+        return self._size
+
+    @torch.inference_mode(False)
+    def _allocate(self, shape: tuple[int, ...], dtype: torch.dtype) -> torch.Tensor:
+        # Allocated outside inference mode even when the first store runs inside it,
+        # so the stored trajectory can still be used in autograd
+        return torch.empty(shape, dtype=dtype, pin_memory=self.pin_memory)
+
+    def _allocate_like(self, batch: torch.Tensor) -> torch.Tensor:
+        return self._allocate((self.max_buffer_size, *batch.shape[1:]), batch.dtype)
+
+    def _write(self, buffer: torch.Tensor, batch: torch.Tensor) -> None:
+        """Copy `batch` into the ring starting at the next slot, wrapping at most once."""
+        n = self.max_buffer_size
+        k = batch.shape[0]
+        start = self._next
+        if k > n:
+            # Only the newest `n` items survive
+            start = (start + k - n) % n
+            batch = batch[k - n :]
+            k = n
+        end = start + k
+        if end <= n:
+            buffer[start:end].copy_(batch)
+        else:
+            split = n - start
+            buffer[start:].copy_(batch[:split])
+            buffer[: end - n].copy_(batch[split:])
+
+    def _ordered(self, buffer: torch.Tensor | None) -> torch.Tensor:
+        """Valid items of `buffer` from oldest to newest (a view unless the ring has wrapped)."""
+        if buffer is None:
+            return torch.empty((0,))
+        if self._size < self.max_buffer_size:
+            return buffer[: self._size]
+        if self._next == 0:
+            return buffer
+        return torch.cat((buffer[self._next :], buffer[: self._next]))
+
+    @property
+    def features_buffer(self) -> torch.Tensor:
+        return self._ordered(self._features)
+
+    @property
+    def actions_buffer(self) -> torch.Tensor:
+        return self._ordered(self._actions)
+
+    @property
+    def rewards_buffer(self) -> torch.Tensor:
+        return self._ordered(self._rewards)
+
+    @property
+    def intrinsic_rewards_buffer(self) -> torch.Tensor:
+        return self._ordered(self._intrinsic_rewards)
+
+    @property
+    def values_buffer(self) -> torch.Tensor:
+        return self._ordered(self._values)
+
+    @property
+    def log_probs_buffer(self) -> torch.Tensor:
+        return self._ordered(self._log_probs)
+
+    @property
+    def focus_buffer(self) -> torch.Tensor:
+        return self._ordered(self._focus)
+
+    @property
+    def focus_logp_buffer(self) -> torch.Tensor:
+        return self._ordered(self._focus_logp)
+
+    def to_device(self, device: torch.device | str) -> dict[str, torch.Tensor]:
+        """
+        Copy the trajectory to `device`.
+
+        The copies are issued with `non_blocking=True`, so with pinned storage the transfer
+        overlaps with whatever the caller does next on the host.
+
+        Parameters
+        ----------
+        device : torch.device | str
+            Device to copy the trajectory to
+
+        Returns
+        -------
+        dict[str, torch.Tensor]
+            Each field of the trajectory, keyed by its `*_buffer` attribute name, in chronological order
+        """
+        fields = {
+            "features_buffer": self.features_buffer,
+            "actions_buffer": self.actions_buffer,
+            "rewards_buffer": self.rewards_buffer,
+            "intrinsic_rewards_buffer": self.intrinsic_rewards_buffer,
+            "values_buffer": self.values_buffer,
+            "log_probs_buffer": self.log_probs_buffer,
+            "focus_buffer": self.focus_buffer,
+            "focus_logp_buffer": self.focus_logp_buffer,
+        }
+        return {
+            name: tensor.to(device, non_blocking=True)
+            for name, tensor in fields.items()
+        }
 
     def store(
         self,
@@ -67,13 +185,88 @@ class TrajectoryBuffer:
         focus_logp : torch.Tensor | None
             Log probability of the focus coordinates
         """
-        self.features_buffer.append(visual_features)
-        self.actions_buffer.append(action)
-        self.rewards_buffer.append(reward)
-        self.intrinsic_rewards_buffer.append(intrinsic_reward)
-        self.values_buffer.append(value)
-        self.log_probs_buffer.append(log_prob)
-        if focus is not None:
-            self.focus_buffer.append(focus)
-        if focus_logp is not None:
-            self.focus_logp_buffer.append(focus_logp)
+        self.store_batch(
+            visual_features.unsqueeze(0),
+            action.unsqueeze(0),
+            torch.tensor([float(reward)]),
+            torch.tensor([float(intrinsic_reward)]),
+            torch.tensor([float(value)]),
+            log_prob.unsqueeze(0),
+            focus=None if focus is None else focus.unsqueeze(0),
+            focus_logp=None if focus_logp is None else focus_logp.unsqueeze(0),
+        )
+
+    @torch.no_grad()
+    def store_batch(
+        self,
+        visual_features: torch.Tensor,
+        actions: torch.Tensor,
+        rewards: torch.Tensor,
+        intrinsic_rewards: torch.Tensor,
+        values: torch.Tensor,
+        log_probs: torch.Tensor,
+        focus: torch.Tensor | None = None,
+        focus_logp: torch.Tensor | None = None,
+    ) -> None:
+        """
+        Append `K` consecutive time-steps to the trajectory with one copy per field.
+
+        Every argument has a leading dimension of size `K`; the remaining dimensions match
+        the corresponding argument of `store`. If `K` exceeds `max_buffer_size`, only the
+        newest `max_buffer_size` time-steps are kept.
+
+        Parameters
+        ----------
+        visual_features : torch.Tensor
+            Features computed by visual perception, shape (K, ...)
+        actions : torch.Tensor
+            Environment action tensors, shape (K, ...)
+        rewards : torch.Tensor
+            Rewards from the environment for the previous actions, shape (K,)
+        intrinsic_rewards : torch.Tensor
+            Rewards from the Intrinsic Curiosity Module (ICM), shape (K,)
+        values : torch.Tensor
+            Values assigned to the observations by the agent, shape (K,)
+        log_probs : torch.Tensor
+            Log probabilities of selecting each environment sub-action, shape (K, ...)
+        focus : torch.Tensor | None
+            Focus/ROI coordinates, shape (K, 2)
+        focus_logp : torch.Tensor | None
+            Log probabilities of the focus coordinates, shape (K, ...)
+
+        Raises
+        ------
+        ValueError
+            If `focus` or `focus_logp` is given in some stores but not in others
+        """
+        if self._features is None:
+            self._features = self._allocate_like(visual_features)
+            self._actions = self._allocate_like(actions)
+            self._log_probs = self._allocate_like(log_probs)
+            if focus is not None:
+                self._focus = self._allocate_like(focus)
+            if focus_logp is not None:
+                self._focus_logp = self._allocate_like(focus_logp)
+        elif (focus is None) != (self._focus is None) or (focus_logp is None) != (
+            self._focus_logp is None
+        ):
+            # Every field shares one ring index, so a skipped slot would misalign the focus
+            raise ValueError(
+                "Expected focus and focus_logp to be given for every store or for none"
+            )
+        assert self._actions is not None and self._log_probs is not None
+
+        self._write(self._features, visual_features)
+        self._write(self._actions, actions)
+        self._write(self._rewards, rewards.reshape(-1))
+        self._write(self._intrinsic_rewards, intrinsic_rewards.reshape(-1))
+        self._write(self._values, values.reshape(-1))
+        self._write(self._log_probs, log_probs)
+        if focus is not None and self._focus is not None:
+            self._write(self._focus, focus)
+        if focus_logp is not None and self._focus_logp is not None:
+            self._write(self._focus_logp, focus_logp)
+
+        k = visual_features.shape[0]
+        self._next = (self._next + k) % self.max_buffer_size
+        self._size = min(self._size + k, self.max_buffer_size)
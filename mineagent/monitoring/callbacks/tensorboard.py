@@ -1,8 +1,15 @@
+import functools
+import logging
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any, TypeVar
+
 import torch
-from torch.utils.tensorboard.writer import SummaryWriter
-from torchvision.utils import make_grid
 from ..event import (
     Action,
+    BatchedAction,
     Start,
     Stop,
     EnvStep,
@@ -12,39 +19,207 @@ from ..event import (
 )
 from ...config import TensorboardConfig
 
+# Maximum number of pending batches before producers block
+_QUEUE_SIZE = 1024
+
+# Queued in place of a batch to stop the worker thread
+_STOP = None
+
+# A single `SummaryWriter` call: (method name, args, kwargs, event marking its args as ready)
+_Call = tuple[str, tuple, dict[str, Any], "torch.cuda.Event | None"]
+
+E = TypeVar("E")
+
+
+def _batched(
+    handler: Callable[["TensorboardWriter", E], None],
+) -> Callable[["TensorboardWriter", E], None]:
+    """Queue every writer call made while handling one event as a single batch."""
+
+    @functools.wraps(handler)
+    def wrapper(self: "TensorboardWriter", event: E) -> None:
+        with self._step_batch():
+            handler(self, event)
+
+    return wrapper
+
 
 class TensorboardWriter:
+    """
+    Logs monitoring events to TensorBoard.
+
+    The `SummaryWriter` calls (histogram serialization, image encoding, file I/O) run on a
+    background thread; the `add_*` handlers only queue them, one batch per event. Use `flush`
+    to wait for every queued call to be written.
+    """
+
     def __init__(self, config: TensorboardConfig) -> None:
+        # Imported here rather than at module level: tensorboard is heavy to import and
+        # is only needed once a writer is actually created
+        from torch.utils.tensorboard.writer import SummaryWriter
+
         # TODO: Add the rest of the configuration
         self.writer = SummaryWriter(
             log_dir=config.log_dir, flush_secs=config.flush_secs
         )
         self.step_counter: dict[str, int] = {}
         self._config = config
+        self._logger = logging.getLogger(__name__)
+        self._queue: queue.Queue[list[_Call] | None] = queue.Queue(maxsize=_QUEUE_SIZE)
+        # Per-thread calls collected for the innermost `_step_batch`, if any
+        self._batch = threading.local()
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._drain, name="tensorboard-writer", daemon=True
+        )
+        self._worker.start()
+
+    def _enqueue(self, method_name: str, *args: Any, **kwargs: Any) -> None:
+        """Queue `self.writer.<method_name>(*args, **kwargs)` for the worker thread."""
+        if self._closed:
+            # Nothing drains the queue any more; blocking on a full queue would hang the caller
+            self._logger.debug(
+                "Dropping %s call on a closed TensorboardWriter", method_name
+            )
+            return
+        # The worker writes later, so snapshot tensors now: callers may reuse their storage
+        # in place (e.g. views of the trajectory ring buffer) before the call is drained
+        staged = any(isinstance(arg, torch.Tensor) and arg.is_cuda for arg in args)
+        args = tuple(self._snapshot(arg) for arg in args)
+        ready = None
+        if staged:
+            ready = torch.cuda.Event()
+            ready.record()
+        call = (method_name, args, kwargs, ready)
+        pending: list[_Call] | None = getattr(self._batch, "pending", None)
+        if pending is not None:
+            pending.append(call)
+        else:
+            self._queue.put([call])
+
+    def _snapshot(self, arg: Any) -> Any:
+        """Copy a tensor argument so later in-place changes by the caller are not logged."""
+        if not isinstance(arg, torch.Tensor):
+            return arg
+        if arg.is_cuda:
+            return self._stage_on_host(arg)
+        return arg.detach().clone()
+
+    def _stage_on_host(self, arg: Any) -> Any:
+        """
+        Start an asynchronous copy of a CUDA tensor into pinned host memory.
 
-    def add_action(self, event: Action) -> None:
-        """Log Action event data to TensorBoard."""
+        Pinned blocks come from PyTorch's caching host allocator, so repeated logging of
+        same-sized tensors reuses them. The copy is only complete once the event recorded
+        by `_enqueue` has fired.
+        """
+        if not (isinstance(arg, torch.Tensor) and arg.is_cuda):
+            return arg
+        host = torch.empty(arg.shape, dtype=arg.dtype, pin_memory=True)
+        host.copy_(arg.detach(), non_blocking=True)
+        return host
+
+    @contextmanager
+    def _step_batch(self) -> Iterator[None]:
+        """
+        Collect the writer calls made inside the block and queue them as one batch.
+
+        Batches are tracked per thread, and a nested batch is queued on its own without
+        touching the enclosing one.
+        """
+        enclosing = getattr(self._batch, "pending", None)
+        calls: list[_Call] = []
+        self._batch.pending = calls
+        try:
+            yield
+        finally:
+            self._batch.pending = enclosing
+            if calls and not self._closed:
+                self._queue.put(calls)
+
+    def _drain(self) -> None:
+        while True:
+            calls = self._queue.get()
+            try:
+                if calls is _STOP:
+                    return
+                for method_name, args, kwargs, ready in calls:
+                    try:
+                        if ready is not None:
+                            ready.synchronize()
+                        getattr(self.writer, method_name)(*args, **kwargs)
+                    except Exception:
+                        self._logger.exception("Failed to write to TensorBoard")
+            finally:
+                self._queue.task_done()
+
+    def _subsample_for_histogram(self, tensor: torch.Tensor) -> torch.Tensor:
+        """Strided sample of at most `histogram_max_elements` values from `tensor`."""
+        max_elements = self._config.histogram_max_elements
+        numel = tensor.numel()
+        if numel <= max_elements:
+            return tensor
+        stride = -(-numel // max_elements)
+        return tensor.flatten()[::stride]
+
+    def flush(self) -> None:
+        """Block until every queued call has been handed to the `SummaryWriter`."""
+        self._queue.join()
+
+    @_batched
+    def add_action(self, event: Action | BatchedAction) -> None:
+        """
+        Log Action event data to TensorBoard.
+
+        A `BatchedAction` is logged as a single step whose histograms cover the whole batch,
+        and advances the action step counter by the batch size.
+        """
         # Get or initialize step counter for actions
         if "action" not in self.step_counter:
             self.step_counter["action"] = 0
         step = self.step_counter["action"]
+        if isinstance(event, BatchedAction):
+            batch_size = event.action.shape[0]
+            intrinsic_reward = event.intrinsic_reward.float().mean()
+        else:
+            batch_size = 1
+            intrinsic_reward = event.intrinsic_reward
 
         # Log action-related tensors
-        self.writer.add_histogram("Action/action", event.action, global_step=step)
-        self.writer.add_histogram(
-            "Action/logp_action", event.logp_action, global_step=step
+        self._enqueue(
+            "add_histogram",
+            "Action/action",
+            self._subsample_for_histogram(event.action),
+            global_step=step,
+        )
+        self._enqueue(
+            "add_histogram",
+            "Action/logp_action",
+            self._subsample_for_histogram(event.logp_action),
+            global_step=step,
         )
-        self.writer.add_histogram("Action/value", event.value, global_step=step)
-        self.writer.add_scalar(
-            "Action/intrinsic_reward", event.intrinsic_reward, global_step=step
+        self._enqueue(
+            "add_histogram",
+            "Action/value",
+            self._subsample_for_histogram(event.value),
+            global_step=step,
+        )
+        self._enqueue(
+            "add_scalar",
+            "Action/intrinsic_reward",
+            intrinsic_reward,
+            global_step=step,
         )
 
         # Log action distribution (if it's a tensor; skip dataclass outputs)
         if event.action_distribution is not None and isinstance(
             event.action_distribution, torch.Tensor
         ):
-            self.writer.add_histogram(
-                "Action/distribution", event.action_distribution, global_step=step
+            self._enqueue(
+                "add_histogram",
+                "Action/distribution",
+                self._subsample_for_histogram(event.action_distribution),
+                global_step=step,
             )
 
         # Log visual features and region of interest as images
@@ -59,20 +234,25 @@ class TensorboardWriter:
             )
 
         # Increment step counter
-        self.step_counter["action"] += 1
+        self.step_counter["action"] += batch_size
 
+    @_batched
     def add_env_step(self, event: EnvStep) -> None:
         # Add scalar for reward
-        self.writer.add_scalar("EnvStep/reward", event.reward, global_step=None)
+        self._enqueue("add_scalar", "EnvStep/reward", event.reward, global_step=None)
 
         # Add images for observation and next_observation
         if event.observation is not None:
-            self.writer.add_image(
-                "EnvStep/observation", event.observation.squeeze(0), dataformats="CHW"
+            self._enqueue(
+                "add_image",
+                "EnvStep/observation",
+                event.observation.squeeze(0),
+                dataformats="CHW",
             )
 
         if event.next_observation is not None:
-            self.writer.add_image(
+            self._enqueue(
+                "add_image",
                 "EnvStep/next_observation",
                 event.next_observation.squeeze(0),
                 dataformats="CHW",
@@ -80,15 +260,25 @@ class TensorboardWriter:
 
         # Add histogram for action (only if it's a tensor)
         if event.action is not None and isinstance(event.action, torch.Tensor):
-            self.writer.add_histogram("EnvStep/action", event.action, global_step=None)
+            self._enqueue(
+                "add_histogram",
+                "EnvStep/action",
+                self._subsample_for_histogram(event.action),
+                global_step=None,
+            )
 
+    @_batched
     def add_env_reset(self, event: EnvReset) -> None:
         # Add image for observation
         if event.observation is not None:
-            self.writer.add_image(
-                "EnvReset/observation", event.observation.squeeze(0), dataformats="CHW"
+            self._enqueue(
+                "add_image",
+                "EnvReset/observation",
+                event.observation.squeeze(0),
+                dataformats="CHW",
             )
 
+    @_batched
     def add_module_forward_start(self, event: ModuleForwardStart) -> None:
         """Handle module forward start events by logging inputs to TensorBoard."""
         module_name = event.name
@@ -108,6 +298,7 @@ class TensorboardWriter:
                         f"{module_name}/input_viz/{key}", value, step
                     )
 
+    @_batched
     def add_module_forward_end(self, event: ModuleForwardEnd) -> None:
         """Handle module forward end events by logging outputs to TensorBoard."""
         module_name = event.name
@@ -132,13 +323,23 @@ class TensorboardWriter:
 
     def add_start(self, event: Start) -> None:
         # Start event only has timestamp which is handled by tensorboard automatically
-        self.writer.add_text("Start/event", "Simulation started", global_step=None)
+        self._enqueue("add_text", "Start/event", "Simulation started", global_step=None)
 
     def add_stop(self, event: Stop) -> None:
         # Stop event only has timestamp which is handled by tensorboard automatically
-        self.writer.add_text("Stop/event", "Simulation stopped", global_step=None)
+        self._enqueue("add_text", "Stop/event", "Simulation stopped", global_step=None)
 
     def close(self) -> None:
+        """
+        Write out every queued call, stop the worker thread and close the writer.
+
+        Calls made after closing are dropped.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._worker.join()
         self.writer.close()
 
     def _log_tensor_stats(self, name: str, tensor: torch.Tensor, step: int) -> None:
@@ -146,53 +347,66 @@ class TensorboardWriter:
         if not tensor.numel():
             return  # Skip empty tensors
 
-        # Ensure tensor is detached and on CPU
-        tensor = tensor.detach().cpu().squeeze()
+        # Reduce on the tensor's own device; `_enqueue` stages CUDA results on the host
+        tensor = tensor.detach().squeeze()
 
-        # Basic statistics
-        self.writer.add_histogram(f"{name}/hist", tensor, step)
-        self.writer.add_scalar(f"{name}/mean", tensor.float().mean(), step)
-        self.writer.add_scalar(f"{name}/std", tensor.float().std(), step)
-        self.writer.add_scalar(f"{name}/min", tensor.float().min(), step)
-        self.writer.add_scalar(f"{name}/max", tensor.float().max(), step)
+        # Basic statistics, two reductions over a single float copy
+        tensor_float = tensor.float()
+        std, mean = torch.std_mean(tensor_float)
+        minimum, maximum = torch.aminmax(tensor_float)
+        self._enqueue(
+            "add_histogram", f"{name}/hist", self._subsample_for_histogram(tensor), step
+        )
+        self._enqueue("add_scalar", f"{name}/mean", mean, step)
+        self._enqueue("add_scalar", f"{name}/std", std, step)
+        self._enqueue("add_scalar", f"{name}/min", minimum, step)
+        self._enqueue("add_scalar", f"{name}/max", maximum, step)
 
     def _try_log_as_image(self, name: str, tensor: torch.Tensor, step: int) -> None:
         """
         Try to log a tensor as an image if possible.
         Handles different tensor shapes appropriately.
         """
-        tensor = tensor.detach().cpu().squeeze()
+        # Grids are built on the tensor's own device; `_enqueue` stages CUDA results on the host
+        tensor = tensor.detach().squeeze()
 
         # Handle different shapes
         if len(tensor.shape) == 2:  # Single grayscale image
-            self.writer.add_image(name, tensor.unsqueeze(0), step, dataformats="CHW")
+            self._enqueue(
+                "add_image", name, tensor.unsqueeze(0), step, dataformats="CHW"
+            )
 
         elif len(tensor.shape) == 3:
             if tensor.shape[0] <= 3:  # Assume CHW format (channels, height, width)
-                self.writer.add_image(name, tensor, step, dataformats="CHW")
+                self._enqueue("add_image", name, tensor, step, dataformats="CHW")
             else:  # Assume batch of grayscale images
                 grid = self._make_grid(tensor.unsqueeze(1))
-                self.writer.add_image(f"{name}/batch", grid, step, dataformats="CHW")
+                self._enqueue(
+                    "add_image", f"{name}/batch", grid, step, dataformats="CHW"
+                )
 
         elif len(tensor.shape) == 4:  # Batch of images
             if tensor.shape[1] <= 3:  # Channels in dimension 1 (BCHW format)
                 grid = self._make_grid(tensor)
-                self.writer.add_image(f"{name}/batch", grid, step, dataformats="CHW")
+                self._enqueue(
+                    "add_image", f"{name}/batch", grid, step, dataformats="CHW"
+                )
 
     def _make_grid(self, tensor: torch.Tensor, max_images: int = 16) -> torch.Tensor:
         """Create a grid of images for visualization."""
+        from torchvision.utils import make_grid
+
         # Limit number of images to avoid large grids
-        tensor = tensor[:max_images]
-        # Normalize for better visualization
-        tensor = self._normalize_for_visualization(tensor)
-        return make_grid(tensor)
-
-    def _normalize_for_visualization(self, tensor: torch.Tensor) -> torch.Tensor:
-        """Normalize tensor values to [0, 1] range for better visualization."""
-        tensor = tensor.float()  # Convert to float
-        if tensor.numel() > 0:
-            min_val = tensor.min()
-            max_val = tensor.max()
-            if min_val != max_val:  # Avoid division by zero
-                tensor = (tensor - min_val) / (max_val - min_val)
-        return tensor
+        tensor = tensor[:max_images].float()
+        if tensor.numel() == 0:
+            return make_grid(tensor)
+        # Normalize the grid in place instead of a normalized copy of the batch; padding
+        # with the minimum keeps it at 0 after normalization
+        min_val, max_val = torch.aminmax(tensor)
+        if min_val == max_val:
+            return make_grid(tensor)
+        grid = make_grid(tensor, pad_value=min_val.item())
+        if grid.untyped_storage().data_ptr() == tensor.untyped_storage().data_ptr():
+            # A single image comes back as a view of the input; normalize a copy of it
+            grid = grid.clone()
+        return grid.sub_(min_val).div_(max_val - min_val)
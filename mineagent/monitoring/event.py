@@ -5,7 +5,7 @@ from typing import Any
 import torch
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """
     Base class for an event. Contains attributes common to all events.
@@ -19,7 +19,7 @@ class Event:
     timestamp: datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class Start(Event):
     """
     The start of the simulation.
@@ -28,7 +28,7 @@ class Start(Event):
     ...
 
 
-@dataclass
+@dataclass(slots=True)
 class Stop(Event):
     """
     The end of the simulation.
@@ -37,7 +37,7 @@ class Stop(Event):
     total_return: float
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvStep(Event):
     """
     After a single action has been taken in the environment.
@@ -54,7 +54,7 @@ class EnvStep(Event):
     reward: float
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvReset(Event):
     """
     After the environment has been reset.
@@ -63,7 +63,7 @@ class EnvReset(Event):
     observation: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Action(Event):
     """
     An action taken by the agent.
@@ -78,7 +78,25 @@ class Action(Event):
     intrinsic_reward: float
 
 
-@dataclass
+@dataclass(slots=True)
+class BatchedAction(Event):
+    """
+    A batch of actions taken by the agent, published once instead of one `Action` per step.
+
+    Every field holds the corresponding `Action` field for all `B` steps, stacked along a new
+    leading dimension.
+    """
+
+    visual_features: torch.Tensor
+    action_distribution: Any
+    action: torch.Tensor
+    logp_action: torch.Tensor
+    value: torch.Tensor
+    region_of_interest: torch.Tensor
+    intrinsic_reward: torch.Tensor
+
+
+@dataclass(slots=True)
 class ModuleForwardStart(Event):
     """
     The start of a `nn.Module.forward` call.
@@ -88,7 +106,7 @@ class ModuleForwardStart(Event):
     inputs: dict[str, torch.Tensor]
 
 
-@dataclass
+@dataclass(slots=True)
 class ModuleForwardEnd(Event):
     """
     The end of a `nn.Module.forward` call.
@@ -1,4 +1,4 @@
-from typing import Callable, Dict, List, Type, TypeVar
+from typing import Callable, Dict, List, Tuple, Type, TypeVar
 
 from .event import Event
 from ..config import MonitoringConfig
@@ -9,6 +9,8 @@ T = TypeVar("T", bound=Event)
 class EventBus:
     def __init__(self, config: MonitoringConfig | None = None) -> None:
         self._listeners: Dict[Type[Event], List[Callable]] = {}
+        # Immutable snapshot of `_listeners` read by `publish`, rebuilt on subscribe
+        self._dispatch: Dict[Type[Event], Tuple[Callable, ...]] = {}
         self._enabled = True  # Global toggle
         self._config = config
 
@@ -32,8 +34,10 @@ class EventBus:
         if not self._enabled:
             return
 
-        event_type = type(event)
-        for listener in self._listeners.get(event_type, []):
+        listeners = self._dispatch.get(type(event))
+        if listeners is None:
+            return
+        for listener in listeners:
             listener(event)
 
     def subscribe(
@@ -54,9 +58,29 @@ class EventBus:
         Callable[[T], None]
             The callback function (for chaining)
         """
-        self._listeners.setdefault(event_type, []).append(callback)
+        listeners = self._listeners.setdefault(event_type, [])
+        listeners.append(callback)
+        self._dispatch[event_type] = tuple(listeners)
         return callback
 
+    def has_listeners(self, event_type: Type[Event]) -> bool:
+        """
+        Whether publishing an event of `event_type` would reach any listener.
+
+        Publishers can check this before building an event to skip that work entirely.
+
+        Parameters
+        ----------
+        event_type : Type[Event]
+            The type of event that would be published
+
+        Returns
+        -------
+        bool
+            True if the event bus is enabled and has a listener for `event_type`
+        """
+        return self._enabled and event_type in self._dispatch
+
     def disable(self) -> None:
         """Disable all event publishing"""
         self._enabled = False
@@ -92,6 +92,8 @@ class FoveatedPerception(nn.Module):
         self.mp3 = nn.AdaptiveMaxPool2d((1, 1))
         self.gelu = nn.GELU()
         self.flatten = nn.Flatten()
+        # NHWC lets cuDNN pick its fastest conv kernels without internal transposes
+        self.to(memory_format=torch.channels_last)
 
     def forward(self, x_img: torch.Tensor) -> torch.Tensor:
         """
@@ -107,6 +109,7 @@ class FoveatedPerception(nn.Module):
         torch.Tensor
             Set of visual features (BS, out_channels, nH, nW)
         """
+        x_img = x_img.contiguous(memory_format=torch.channels_last)
         x = self.gelu(self.mp1(self.conv1(x_img)))
         x = self.gelu(self.mp2(self.conv2(x)))
         x = self.gelu(self.mp3(self.conv3(x)))
@@ -139,6 +142,8 @@ class PeripheralPerception(nn.Module):
         self.mp2 = nn.AdaptiveMaxPool2d((1, 1))
         self.gelu = nn.GELU()
         self.flatten = nn.Flatten()
+        # NHWC lets cuDNN pick its fastest conv kernels without internal transposes
+        self.to(memory_format=torch.channels_last)
 
     def forward(self, x_img: torch.Tensor) -> torch.Tensor:
         """
@@ -154,6 +159,7 @@ class PeripheralPerception(nn.Module):
         torch.Tensor
             Set of visual features (BS, out_channels, nH, nW)
         """
+        x_img = x_img.contiguous(memory_format=torch.channels_last)
         x = self.gelu(self.mp1(self.conv1(x_img)))
         x = self.gelu(self.mp2(self.conv2(x)))
         return self.flatten(x)
@@ -1,3 +1,4 @@
+import torch
 import torch.nn as nn
 
 from ..utils import add_forward_hooks
@@ -17,6 +18,28 @@ class LinearCritic(nn.Module):
         # Monitoring
         self.start_monitoring()
 
+    @classmethod
+    def compiled(cls, embed_dim: int) -> nn.Module:
+        """
+        Build a critic compiled with `torch.compile` into a single graph.
+
+        Monitoring hooks publish Python events that cannot be traced, so they are removed
+        before compiling.
+
+        Parameters
+        ----------
+        embed_dim : int
+            Size of the input features
+
+        Returns
+        -------
+        nn.Module
+            The compiled critic
+        """
+        critic = cls(embed_dim)
+        critic.stop_monitoring()
+        return torch.compile(critic, fullgraph=True, dynamic=False)
+
     def forward(self, x):
         return self.l1(x)
 
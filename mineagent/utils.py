@@ -1,12 +1,13 @@
 from __future__ import annotations
 
+import atexit
 from datetime import datetime
 import logging
 from math import floor
 from typing import TYPE_CHECKING
 
 import numpy as np
-import scipy  # type: ignore
+from scipy.signal import lfilter  # type: ignore
 import torch
 import torch.nn as nn
 from torch.utils.hooks import RemovableHandle
@@ -17,6 +18,7 @@ from .monitoring.event import (
     EnvStep,
     EnvReset,
     Action,
+    BatchedAction,
     Start,
     Stop,
 )
@@ -112,9 +114,41 @@ def compute_stride(input_shape, target_shape, kernel_size):
     return stride
 
 
-def discount_cumsum(x: np.ndarray, discount: float) -> np.ndarray:
-    """Taken from https://github.com/openai/spinningup/blob/master/spinup/algos/pytorch/ppo/core.py#L29"""
-    return scipy.signal.lfilter([1], [1, float(-discount)], x[::-1], axis=0)[::-1]
+def discount_cumsum(x: np.ndarray, discount: float, axis: int = 0) -> np.ndarray:
+    """
+    Taken from https://github.com/openai/spinningup/blob/master/spinup/algos/pytorch/ppo/core.py#L29
+
+    The recurrence ``y[t] = x[t] + discount * y[t + 1]`` runs as a C IIR filter over the
+    reversed input, except for a discount of 0 (a copy) and 1 (a reversed cumsum). The result
+    is computed and returned as C-contiguous float32 (the dtype used for training tensors), so
+    it can be wrapped by `torch.from_numpy` without another copy or cast.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Values to accumulate, e.g. rewards. May hold several sequences stacked along the
+        other axes, which are all accumulated in one call
+    discount : float
+        Discount applied per step
+    axis : int, optional
+        Time axis of `x`
+
+    Returns
+    -------
+    np.ndarray
+        Discounted cumulative sums along `axis`, same shape as `x`, as float32
+    """
+    if discount == 0.0:
+        return np.array(x, dtype=np.float32, copy=True)
+    reversed_x = np.flip(np.asarray(x, dtype=np.float32), axis=axis)
+    if discount == 1.0:
+        out = np.cumsum(reversed_x, axis=axis, dtype=np.float32)
+    else:
+        # float32 coefficients keep lfilter from promoting the output to float64
+        b = np.ones(1, dtype=np.float32)
+        a = np.array([1.0, -discount], dtype=np.float32)
+        out = lfilter(b, a, reversed_x, axis=axis)
+    return np.ascontiguousarray(np.flip(out, axis=axis))
 
 
 def statistics(x: torch.Tensor) -> tuple[torch.Tensor, torch.Tensor]:
@@ -263,6 +297,8 @@ def add_forward_hooks(module: nn.Module, prefix: str = "") -> list[RemovableHand
 
     def _pre_hook(module_name):
         def hook(module, inputs):
+            if not event_bus.has_listeners(ModuleForwardStart):
+                return None
             # Convert inputs to a standardized format for logging
             formatted_inputs = _format_tensors_for_logging(inputs)
             # Publish event
@@ -277,6 +313,8 @@ def add_forward_hooks(module: nn.Module, prefix: str = "") -> list[RemovableHand
 
     def _post_hook(module_name):
         def hook(module, inputs, outputs):
+            if not event_bus.has_listeners(ModuleForwardEnd):
+                return None
             # Convert outputs to a standardized format for logging
             formatted_outputs = _format_tensors_for_logging(outputs)
             # Publish event
@@ -345,3 +383,6 @@ def setup_tensorboard(config: TensorboardConfig) -> None:
     event_bus.subscribe(EnvStep, writer.add_env_step)
     event_bus.subscribe(EnvReset, writer.add_env_reset)
     event_bus.subscribe(Action, writer.add_action)
+    event_bus.subscribe(BatchedAction, writer.add_action)
+    # The worker is a daemon thread; write out whatever is still queued before exiting
+    atexit.register(writer.close)
@@ -6,14 +6,47 @@ This client connects to the Unix domain sockets created by the MineAgent mod
 and allows you to send raw input (GLFW key codes, mouse, scroll) for testing.
 """
 
+import asyncio
+import contextlib
+import os
 import socket
-import struct
+import sys
 import time
 import threading
+from collections.abc import Callable
+from functools import partial
 from typing import Optional
 import argparse
 
-from mineagent.client import GLFW, RawInput, COMMAND_TO_KEY
+from mineagent.client import GLFW, HEADER_STRUCT, RawInput, COMMAND_TO_KEY
+
+# Size of each recv_into call on the observation socket
+_RECV_CHUNK_SIZE = 65536
+
+# Send buffer size for the action socket
+_ACTION_SNDBUF_SIZE = 1 << 20
+
+# Fairness caps per readiness wakeup
+_MAX_RECVS_PER_WAKEUP = 64
+_MAX_FRAMES_PER_WAKEUP = 64
+
+_HELP_COMMANDS = frozenset(("help", "h", "?"))
+_QUIT_COMMANDS = frozenset(("quit", "q"))
+
+# One-shot clicks: command -> mouse button
+_CLICK_COMMANDS: dict[str, int] = {
+    "lclick": GLFW.MOUSE_BUTTON_LEFT,
+    "rclick": GLFW.MOUSE_BUTTON_RIGHT,
+    "mclick": GLFW.MOUSE_BUTTON_MIDDLE,
+}
+
+# Persistent holds: command -> (mouse button, pressed)
+_MOUSE_HOLD_COMMANDS: dict[str, tuple[int, bool]] = {
+    "ldown": (GLFW.MOUSE_BUTTON_LEFT, True),
+    "lup": (GLFW.MOUSE_BUTTON_LEFT, False),
+    "rdown": (GLFW.MOUSE_BUTTON_RIGHT, True),
+    "rup": (GLFW.MOUSE_BUTTON_RIGHT, False),
+}
 
 
 class RawInputTestClient:
@@ -29,6 +62,10 @@ class RawInputTestClient:
         try:
             self.action_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             self.action_socket.connect(self.action_socket_path)
+            # Room for bursts of inputs without blocking on the mod's reader
+            self.action_socket.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, _ACTION_SNDBUF_SIZE
+            )
             self.connected = True
             print(f"✓ Connected to action socket: {self.action_socket_path}")
             return True
@@ -52,7 +89,61 @@ class RawInputTestClient:
 
         try:
             input_bytes = raw_input.to_bytes()
-            self.action_socket.send(input_bytes)
+            self.action_socket.sendall(input_bytes)
+            print(
+                f"✓ Sent raw input: {len(input_bytes)} bytes, {len(raw_input.key_codes)} keys"
+            )
+            return True
+        except Exception as e:
+            print(f"✗ Failed to send raw input: {e}")
+            return False
+
+
+class AsyncRawInputTestClient:
+    """Asyncio counterpart of RawInputTestClient used by the interactive mode."""
+
+    def __init__(self, action_socket_path: str = "/tmp/mineagent_action.sock"):
+        self.action_socket_path = action_socket_path
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self.connected = False
+
+    async def connect(self) -> bool:
+        """Connect to the action socket."""
+        try:
+            self._reader, self._writer = await asyncio.open_unix_connection(
+                self.action_socket_path
+            )
+            # Room for combo/say bursts without blocking on the mod's reader
+            sock = self._writer.get_extra_info("socket")
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, _ACTION_SNDBUF_SIZE)
+            self.connected = True
+            print(f"✓ Connected to action socket: {self.action_socket_path}")
+            return True
+        except Exception as e:
+            print(f"✗ Failed to connect to action socket: {e}")
+            return False
+
+    async def disconnect(self):
+        """Disconnect from the action socket."""
+        if self._writer:
+            self._writer.close()
+            await self._writer.wait_closed()
+            self._writer = None
+        self._reader = None
+        self.connected = False
+        print("✓ Disconnected from action socket")
+
+    async def send_raw_input(self, raw_input: RawInput) -> bool:
+        """Send raw input to the mod."""
+        if not self.connected or not self._writer:
+            print("✗ Not connected to action socket")
+            return False
+
+        try:
+            input_bytes = raw_input.to_bytes()
+            self._writer.write(input_bytes)
+            await self._writer.drain()
             print(
                 f"✓ Sent raw input: {len(input_bytes)} bytes, {len(raw_input.key_codes)} keys"
             )
@@ -72,12 +163,17 @@ class ObservationTestClient:
         self.observation_socket: Optional[socket.socket] = None
         self.connected = False
         self.running = False
+        # Persistent receive buffer; unread bytes live in [_rpos, _rend)
+        self._rbuf = bytearray(_RECV_CHUNK_SIZE)
+        self._rpos = 0
+        self._rend = 0
 
     def connect(self) -> bool:
         """Connect to the observation socket."""
         try:
             self.observation_socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             self.observation_socket.connect(self.observation_socket_path)
+            self._rpos = self._rend = 0
             self.connected = True
             print(f"✓ Connected to observation socket: {self.observation_socket_path}")
             return True
@@ -94,8 +190,13 @@ class ObservationTestClient:
         self.connected = False
         print("✓ Disconnected from observation socket")
 
-    def receive_observations(self):
-        """Continuously receive and print observation info."""
+    async def receive_observations(self):
+        """Continuously receive and print observation info.
+
+        The socket is switched to non-blocking mode and drained until it
+        would block, so a burst of observations is handled with one wakeup
+        instead of several blocking reads per frame.
+        """
         if not self.connected or not self.observation_socket:
             print("✗ Not connected to observation socket")
             return
@@ -103,45 +204,86 @@ class ObservationTestClient:
         self.running = True
         observation_count = 0
 
+        self.observation_socket.setblocking(False)
+
+        socket_open = True
         try:
             while self.running:
-                reward_data = self._read_exact(8)
-                if not reward_data:
-                    break
-                reward = struct.unpack(">d", reward_data)[0]
-
-                length_data = self._read_exact(4)
-                if not length_data:
-                    break
-                frame_length = struct.unpack(">I", length_data)[0]
-
-                frame_data = self._read_exact(frame_length)
-                if not frame_data:
-                    break
+                frames = self._parse_frames()
+                if not frames:
+                    if not socket_open:
+                        break
+                    await self._wait_readable()
+                    socket_open = self._drain_socket()
+                    continue
 
-                observation_count += 1
-                print(
-                    f"✓ Observation #{observation_count}: reward={reward:.3f}, frame={frame_length} bytes"
-                )
+                for reward, frame_length in frames:
+                    observation_count += 1
+                    print(
+                        f"✓ Observation #{observation_count}: reward={reward:.3f}, frame={frame_length} bytes"
+                    )
+                # Let the input loop run between batches
+                await asyncio.sleep(0)
 
         except Exception as e:
             print(f"✗ Error receiving observations: {e}")
 
-    def _read_exact(self, n: int) -> Optional[bytes]:
-        """Read exactly n bytes from the socket."""
+    async def _wait_readable(self) -> None:
+        """Suspend until the observation socket has data (or EOF) to read."""
         if not self.observation_socket:
-            return None
+            return
+        loop = asyncio.get_running_loop()
+        readable = loop.create_future()
+        fd = self.observation_socket.fileno()
+        loop.add_reader(fd, lambda: readable.done() or readable.set_result(None))
+        try:
+            await readable
+        finally:
+            loop.remove_reader(fd)
+
+    def _drain_socket(self) -> bool:
+        """
+        Read everything currently available on the socket into the buffer.
 
-        data = b""
-        while len(data) < n:
+        Returns False if the connection was closed or errored.
+        """
+        if not self.observation_socket:
+            return False
+
+        for _ in range(_MAX_RECVS_PER_WAKEUP):
+            # Move the unread residue to the front and make room for a chunk
+            residue = self._rend - self._rpos
+            if self._rpos > 0:
+                self._rbuf[:residue] = self._rbuf[self._rpos : self._rend]
+                self._rpos = 0
+                self._rend = residue
+            if len(self._rbuf) - self._rend < _RECV_CHUNK_SIZE:
+                self._rbuf.extend(bytes(_RECV_CHUNK_SIZE))
             try:
-                chunk = self.observation_socket.recv(n - len(data))
-                if not chunk:
-                    return None
-                data += chunk
+                with memoryview(self._rbuf) as view:
+                    received = self.observation_socket.recv_into(view[self._rend :])
+            except BlockingIOError:
+                return True
             except Exception:
-                return None
-        return data
+                return False
+            if not received:
+                return False
+            self._rend += received
+        return True
+
+    def _parse_frames(self) -> list[tuple[float, int]]:
+        """Consume complete observations from the buffer as (reward, frame length)."""
+        frames = []
+        while len(frames) < _MAX_FRAMES_PER_WAKEUP:
+            available = self._rend - self._rpos
+            if available < HEADER_STRUCT.size:
+                break
+            reward, frame_length = HEADER_STRUCT.unpack_from(self._rbuf, self._rpos)
+            if available < HEADER_STRUCT.size + frame_length:
+                break
+            self._rpos += HEADER_STRUCT.size + frame_length
+            frames.append((reward, frame_length))
+        return frames
 
 
 def show_help():
@@ -227,6 +369,151 @@ class HeldState:
         self.mouse_buttons = 0
 
 
+def _parse_help(
+    parts: list[str], held_keys: set[int], held_state: HeldState
+) -> Optional[RawInput]:
+    show_help()
+    return None
+
+
+def _parse_mouse(
+    parts: list[str], held_keys: set[int], held_state: HeldState
+) -> Optional[RawInput]:
+    try:
+        mouse_dx = float(parts[1])
+        mouse_dy = float(parts[2])
+    except ValueError:
+        print("✗ Invalid mouse coordinates. Use: mouse <x> <y>")
+        return None
+    return RawInput(
+        key_codes=list(held_state.keys),
+        mouse_dx=mouse_dx,
+        mouse_dy=mouse_dy,
+        mouse_buttons=held_state.mouse_buttons,
+    )
+
+
+def _parse_scroll(
+    parts: list[str], held_keys: set[int], held_state: HeldState
+) -> Optional[RawInput]:
+    try:
+        scroll_delta = float(parts[1])
+    except ValueError:
+        print("✗ Invalid scroll amount. Use: scroll <amount>")
+        return None
+    return RawInput(
+        key_codes=list(held_state.keys),
+        mouse_buttons=held_state.mouse_buttons,
+        scroll_delta=scroll_delta,
+    )
+
+
+def _parse_text(
+    parts: list[str], held_keys: set[int], held_state: HeldState
+) -> Optional[RawInput]:
+    return RawInput(
+        key_codes=list(held_state.keys),
+        mouse_buttons=held_state.mouse_buttons,
+        text=" ".join(parts[1:]),
+    )
+
+
+def _parse_say(
+    parts: list[str], held_keys: set[int], held_state: HeldState
+) -> Optional[RawInput]:
+    message = " ".join(parts[1:])
+    return RawInput(key_codes=[GLFW.KEY_T], text=f"__SAY__{message}")
+
+
+def _parse_click(
+    button: int, parts: list[str], held_keys: set[int], held_state: HeldState
+) -> Optional[RawInput]:
+    return RawInput(
+        key_codes=list(held_state.keys),
+        mouse_buttons=held_state.mouse_buttons | (1 << button),
+    )
+
+
+def _parse_mouse_hold(
+    button: int,
+    pressed: bool,
+    parts: list[str],
+    held_keys: set[int],
+    held_state: HeldState,
+) -> Optional[RawInput]:
+    held_state.set_mouse_button(button, pressed)
+    return RawInput(
+        key_codes=list(held_state.keys), mouse_buttons=held_state.mouse_buttons
+    )
+
+
+def _parse_release(
+    parts: list[str], held_keys: set[int], held_state: HeldState
+) -> Optional[RawInput]:
+    held_keys.clear()
+    held_state.clear()
+    return RawInput()
+
+
+def _parse_combo(
+    parts: list[str], held_keys: set[int], held_state: HeldState
+) -> Optional[RawInput]:
+    key_codes = [COMMAND_TO_KEY[name] for name in parts[1:] if name in COMMAND_TO_KEY]
+    return RawInput(key_codes=key_codes, mouse_buttons=held_state.mouse_buttons)
+
+
+def _parse_hold(
+    parts: list[str], held_keys: set[int], held_state: HeldState
+) -> Optional[RawInput]:
+    for action_name in parts[1:]:
+        key_code = COMMAND_TO_KEY.get(action_name)
+        if key_code is not None:
+            held_state.keys.add(key_code)
+            held_keys.add(key_code)
+    return RawInput(
+        key_codes=list(held_state.keys), mouse_buttons=held_state.mouse_buttons
+    )
+
+
+def _parse_key(
+    parts: list[str], held_keys: set[int], held_state: HeldState
+) -> Optional[RawInput]:
+    """Fallback: a named key from COMMAND_TO_KEY or a raw GLFW key code."""
+    main_command = parts[0]
+    key_code = COMMAND_TO_KEY.get(main_command)
+    if key_code is None:
+        try:
+            key_code = int(main_command)
+        except ValueError:
+            print(f"✗ Unknown command: {main_command}")
+            return None
+    return RawInput(key_codes=[key_code], mouse_buttons=held_state.mouse_buttons)
+
+
+CommandParser = Callable[[list[str], set[int], HeldState], Optional[RawInput]]
+
+# command -> (minimum number of tokens including the command, parser).
+# Commands given too few tokens fall back to _parse_key.
+_COMMAND_PARSERS: dict[str, tuple[int, CommandParser]] = {
+    **{name: (1, _parse_help) for name in _HELP_COMMANDS},
+    "mouse": (3, _parse_mouse),
+    "scroll": (2, _parse_scroll),
+    "text": (2, _parse_text),
+    "say": (2, _parse_say),
+    **{
+        name: (1, partial(_parse_click, button))
+        for name, button in _CLICK_COMMANDS.items()
+    },
+    **{
+        name: (1, partial(_parse_mouse_hold, button, pressed))
+        for name, (button, pressed) in _MOUSE_HOLD_COMMANDS.items()
+    },
+    "release": (1, _parse_release),
+    "combo": (2, _parse_combo),
+    "hold": (2, _parse_hold),
+}
+
+
 def parse_command(
     command_line: str, held_keys: set[int], held_state: Optional["HeldState"] = None
 ) -> Optional[RawInput]:
@@ -249,148 +536,67 @@ def parse_command(
     if not parts:
         return None
 
-    main_command = parts[0]
-
-    if main_command in ["help", "h", "?"]:
-        show_help()
-        return None
+    min_parts, parser = _COMMAND_PARSERS.get(parts[0], (1, _parse_key))
+    if len(parts) < min_parts:
+        parser = _parse_key
+    return parser(parts, held_keys, held_state)
 
-    raw_input = RawInput()
 
-    if main_command == "mouse" and len(parts) >= 3:
-        try:
-            raw_input.mouse_dx = float(parts[1])
-            raw_input.mouse_dy = float(parts[2])
-            raw_input.key_codes = list(held_state.keys)
-            raw_input.mouse_buttons = held_state.mouse_buttons
-            return raw_input
-        except ValueError:
-            print("✗ Invalid mouse coordinates. Use: mouse <x> <y>")
-            return None
+def _read_stdin_lines(loop: asyncio.AbstractEventLoop, lines: asyncio.Queue):
+    """
+    Forward stdin lines to the event loop; None signals EOF.
 
-    if main_command == "scroll" and len(parts) >= 2:
+    Reads the raw file descriptor rather than sys.stdin so this daemon thread
+    never holds the stdin buffer lock while the interpreter shuts down.
+    """
+    pending = b""
+    while True:
+        data = os.read(sys.stdin.fileno(), 4096)
+        pending += data
+        *complete, pending = pending.split(b"\n")
+        queued: list[Optional[str]] = [line.decode() for line in complete]
+        if not data:
+            queued.append(pending.decode() or None)
+            if queued[-1] is not None:
+                queued.append(None)
         try:
-            raw_input.scroll_delta = float(parts[1])
-            raw_input.key_codes = list(held_state.keys)
-            raw_input.mouse_buttons = held_state.mouse_buttons
-            return raw_input
-        except ValueError:
-            print("✗ Invalid scroll amount. Use: scroll <amount>")
-            return None
-
-    if main_command == "text" and len(parts) >= 2:
-        raw_input.text = " ".join(parts[1:])
-        raw_input.key_codes = list(held_state.keys)
-        raw_input.mouse_buttons = held_state.mouse_buttons
-        return raw_input
-
-    if main_command == "say" and len(parts) >= 2:
-        message = " ".join(parts[1:])
-        raw_input.key_codes = [GLFW.KEY_T]
-        raw_input.text = f"__SAY__{message}"
-        return raw_input
-
-    if main_command == "lclick":
-        raw_input.mouse_buttons = held_state.mouse_buttons | (
-            1 << GLFW.MOUSE_BUTTON_LEFT
-        )
-        raw_input.key_codes = list(held_state.keys)
-        return raw_input
-    if main_command == "rclick":
-        raw_input.mouse_buttons = held_state.mouse_buttons | (
-            1 << GLFW.MOUSE_BUTTON_RIGHT
-        )
-        raw_input.key_codes = list(held_state.keys)
-        return raw_input
-    if main_command == "mclick":
-        raw_input.mouse_buttons = held_state.mouse_buttons | (
-            1 << GLFW.MOUSE_BUTTON_MIDDLE
-        )
-        raw_input.key_codes = list(held_state.keys)
-        return raw_input
-
-    if main_command == "ldown":
-        held_state.set_mouse_button(GLFW.MOUSE_BUTTON_LEFT, True)
-        raw_input.mouse_buttons = held_state.mouse_buttons
-        raw_input.key_codes = list(held_state.keys)
-        return raw_input
-    if main_command == "lup":
-        held_state.set_mouse_button(GLFW.MOUSE_BUTTON_LEFT, False)
-        raw_input.mouse_buttons = held_state.mouse_buttons
-        raw_input.key_codes = list(held_state.keys)
-        return raw_input
-    if main_command == "rdown":
-        held_state.set_mouse_button(GLFW.MOUSE_BUTTON_RIGHT, True)
-        raw_input.mouse_buttons = held_state.mouse_buttons
-        raw_input.key_codes = list(held_state.keys)
-        return raw_input
-    if main_command == "rup":
-        held_state.set_mouse_button(GLFW.MOUSE_BUTTON_RIGHT, False)
-        raw_input.mouse_buttons = held_state.mouse_buttons
-        raw_input.key_codes = list(held_state.keys)
-        return raw_input
-
-    if main_command == "release":
-        held_keys.clear()
-        held_state.clear()
-        return raw_input
-
-    if main_command == "combo" and len(parts) > 1:
-        for action_name in parts[1:]:
-            if action_name in COMMAND_TO_KEY:
-                raw_input.key_codes.append(COMMAND_TO_KEY[action_name])
-        raw_input.mouse_buttons = held_state.mouse_buttons
-        return raw_input
-
-    if main_command == "hold" and len(parts) > 1:
-        for action_name in parts[1:]:
-            if action_name in COMMAND_TO_KEY:
-                held_state.keys.add(COMMAND_TO_KEY[action_name])
-                held_keys.add(COMMAND_TO_KEY[action_name])
-        raw_input.key_codes = list(held_state.keys)
-        raw_input.mouse_buttons = held_state.mouse_buttons
-        return raw_input
-
-    if main_command in COMMAND_TO_KEY:
-        raw_input.key_codes = [COMMAND_TO_KEY[main_command]]
-        raw_input.mouse_buttons = held_state.mouse_buttons
-        return raw_input
-
-    try:
-        key_code = int(main_command)
-        raw_input.key_codes = [key_code]
-        raw_input.mouse_buttons = held_state.mouse_buttons
-        return raw_input
-    except ValueError:
-        pass
-
-    print(f"✗ Unknown command: {main_command}")
-    return None
+            for line in queued:
+                loop.call_soon_threadsafe(lines.put_nowait, line)
+        except RuntimeError:
+            return  # event loop already closed
+        if not data:
+            return
 
 
-def run_interactive_mode():
+async def run_interactive_mode():
     """Run interactive mode for testing raw input."""
-    client = RawInputTestClient()
+    client = AsyncRawInputTestClient()
     observation_client = ObservationTestClient()
+    observation_task: Optional[asyncio.Task] = None
     held_state = HeldState()
     held_keys = held_state.keys
 
     print("MineAgent Raw Input Test Client - Interactive Mode")
     print("=" * 50)
 
-    if not client.connect():
+    if not await client.connect():
         return
 
-    print("\nDo you want to monitor observations? (y/n): ", end="")
-    try:
-        if input().lower().startswith("y"):
-            if observation_client.connect():
-                obs_thread = threading.Thread(
-                    target=observation_client.receive_observations, daemon=True
-                )
-                obs_thread.start()
-    except EOFError:
-        pass
+    # Reading stdin blocks, so it runs on a daemon thread that cannot hold up exit
+    lines: asyncio.Queue[Optional[str]] = asyncio.Queue()
+    threading.Thread(
+        target=_read_stdin_lines,
+        args=(asyncio.get_running_loop(), lines),
+        daemon=True,
+    ).start()
+
+    print("\nDo you want to monitor observations? (y/n): ", end="", flush=True)
+    answer = await lines.get()
+    if answer is not None and answer.lower().startswith("y"):
+        if observation_client.connect():
+            observation_task = asyncio.create_task(
+                observation_client.receive_observations()
+            )
 
     print("\nInteractive Raw Input Testing Started")
     print("Type 'help' for command reference, 'quit' to exit")
@@ -399,14 +605,21 @@ def run_interactive_mode():
     try:
         while True:
             try:
-                command_line = input("RawInput> ").strip()
+                print("RawInput> ", end="", flush=True)
+                line = await lines.get()
+                if line is None:
+                    print("\nEOF received, exiting...")
+                    break
+                command_line = line.strip()
 
                 if not command_line:
                     continue
 
-                if command_line.lower() in ["quit", "q"]:
+                # Only the meta-commands need this; parse_command lowercases itself
+                meta_command = command_line.lower()
+                if meta_command in _QUIT_COMMANDS:
                     break
-                elif command_line.lower() == "status":
+                elif meta_command == "status":
                     print(
                         f"✓ Action socket: {'Connected' if client.connected else 'Disconnected'}"
                     )
@@ -418,11 +631,11 @@ def run_interactive_mode():
                         f"✓ Held mouse buttons: {held_state.mouse_buttons} (L={bool(held_state.mouse_buttons & 1)}, R={bool(held_state.mouse_buttons & 2)}, M={bool(held_state.mouse_buttons & 4)})"
                     )
                     continue
-                elif command_line.lower() == "clear":
+                elif meta_command == "clear":
                     print("\033[2J\033[H")
                     continue
-                elif command_line.lower() == "test":
-                    run_test_sequence(client)
+                elif meta_command == "test":
+                    await run_test_sequence_async(client)
                     continue
 
                 raw_input = parse_command(command_line, held_keys, held_state)
@@ -431,57 +644,61 @@ def run_interactive_mode():
                         message = raw_input.text[7:]
                         print(f"  Opening chat and typing: {message}")
 
-                        client.send_raw_input(RawInput(key_codes=[GLFW.KEY_T]))
-                        time.sleep(0.15)
+                        await client.send_raw_input(RawInput(key_codes=[GLFW.KEY_T]))
+                        await asyncio.sleep(0.15)
 
-                        client.send_raw_input(RawInput())
-                        time.sleep(0.05)
+                        await client.send_raw_input(RawInput())
+                        await asyncio.sleep(0.05)
 
-                        client.send_raw_input(RawInput(text=message))
-                        time.sleep(0.05)
+                        await client.send_raw_input(RawInput(text=message))
+                        await asyncio.sleep(0.05)
 
-                        client.send_raw_input(RawInput(key_codes=[GLFW.KEY_ENTER]))
-                        time.sleep(0.05)
+                        await client.send_raw_input(
+                            RawInput(key_codes=[GLFW.KEY_ENTER])
+                        )
+                        await asyncio.sleep(0.05)
 
-                        client.send_raw_input(RawInput())
+                        await client.send_raw_input(RawInput())
                     else:
-                        client.send_raw_input(raw_input)
+                        await client.send_raw_input(raw_input)
 
-            except EOFError:
-                print("\nEOF received, exiting...")
-                break
             except Exception as e:
                 print(f"✗ Error processing command: {e}")
 
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\nInterrupted by user")
     finally:
-        client.send_raw_input(RawInput())
-        client.disconnect()
+        if observation_task is not None:
+            observation_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await observation_task
+        await client.send_raw_input(RawInput())
+        await client.disconnect()
         observation_client.disconnect()
 
 
+TEST_SEQUENCE: list[tuple[str, RawInput]] = [
+    ("Move Forward (W)", RawInput(key_codes=[GLFW.KEY_W])),
+    ("Move Left (A)", RawInput(key_codes=[GLFW.KEY_A])),
+    ("Move Back (S)", RawInput(key_codes=[GLFW.KEY_S])),
+    ("Move Right (D)", RawInput(key_codes=[GLFW.KEY_D])),
+    ("Jump (Space)", RawInput(key_codes=[GLFW.KEY_SPACE])),
+    ("Turn Right", RawInput(mouse_dx=50.0)),
+    ("Turn Left", RawInput(mouse_dx=-50.0)),
+    ("Look Up", RawInput(mouse_dy=-30.0)),
+    ("Look Down", RawInput(mouse_dy=30.0)),
+    ("Left Click", RawInput(mouse_buttons=1)),
+    ("Right Click", RawInput(mouse_buttons=2)),
+    ("Scroll Up", RawInput(scroll_delta=1.0)),
+    ("Release All", RawInput()),
+]
+
+
 def run_test_sequence(client: RawInputTestClient):
     """Run a quick test sequence."""
     print("Running test sequence...")
 
-    tests = [
-        ("Move Forward (W)", RawInput(key_codes=[GLFW.KEY_W])),
-        ("Move Left (A)", RawInput(key_codes=[GLFW.KEY_A])),
-        ("Move Back (S)", RawInput(key_codes=[GLFW.KEY_S])),
-        ("Move Right (D)", RawInput(key_codes=[GLFW.KEY_D])),
-        ("Jump (Space)", RawInput(key_codes=[GLFW.KEY_SPACE])),
-        ("Turn Right", RawInput(mouse_dx=50.0)),
-        ("Turn Left", RawInput(mouse_dx=-50.0)),
-        ("Look Up", RawInput(mouse_dy=-30.0)),
-        ("Look Down", RawInput(mouse_dy=30.0)),
-        ("Left Click", RawInput(mouse_buttons=1)),
-        ("Right Click", RawInput(mouse_buttons=2)),
-        ("Scroll Up", RawInput(scroll_delta=1.0)),
-        ("Release All", RawInput()),
-    ]
-
-    for name, raw_input in tests:
+    for name, raw_input in TEST_SEQUENCE:
         print(f"  Testing: {name}")
         client.send_raw_input(raw_input)
         time.sleep(0.3)
@@ -489,6 +706,18 @@ def run_test_sequence(client: RawInputTestClient):
     print("✓ Test sequence completed")
 
 
+async def run_test_sequence_async(client: AsyncRawInputTestClient):
+    """Run the quick test sequence without blocking the event loop."""
+    print("Running test sequence...")
+
+    for name, raw_input in TEST_SEQUENCE:
+        print(f"  Testing: {name}")
+        await client.send_raw_input(raw_input)
+        await asyncio.sleep(0.3)
+
+    print("✓ Test sequence completed")
+
+
 def run_automated_test():
     """Run automated test sequence."""
     client = RawInputTestClient()
@@ -529,7 +758,10 @@ def main():
     if args.auto:
         run_automated_test()
     else:
-        run_interactive_mode()
+        try:
+            asyncio.run(run_interactive_mode())
+        except KeyboardInterrupt:
+            pass
 
 
 if __name__ == "__main__":
@@ -8,14 +8,28 @@ from mineagent.client.protocol import NUM_KEYS
 EMBED_DIM = 64
 BATCH = 32
 
+# Every head is a Linear(EMBED_DIM, n) with bias, i.e. (EMBED_DIM + 1) * n params:
+# key_head: NUM_KEYS
+# mouse_dx mean+logstd: 2 * 1
+# mouse_dy mean+logstd: 2 * 1
+# mouse_button_head: 3
+# scroll mean+logstd: 2 * 1
+# focus means+logstds: 2 * 2
+EXPECTED_PARAMS = (EMBED_DIM + 1) * (NUM_KEYS + 2 + 2 + 3 + 2 + 4)
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def linear_affector_module():
     return LinearAffector(embed_dim=EMBED_DIM)
 
 
-def test_linear_affector_forward(linear_affector_module):
-    input_tensor = torch.randn((BATCH, EMBED_DIM))
+@pytest.fixture(scope="module")
+def linear_affector_param_count(linear_affector_module) -> int:
+    return sum(p.numel() for p in linear_affector_module.parameters())
+
+
+def test_linear_affector_forward(linear_affector_module, rng: torch.Generator):
+    input_tensor = torch.randn((BATCH, EMBED_DIM), generator=rng)
 
     out = linear_affector_module(input_tensor)
 
@@ -38,20 +52,5 @@ def test_linear_affector_forward(linear_affector_module):
     assert (out.focus_stds > 0).all()
 
 
-def test_linear_affector_params(linear_affector_module):
-    num_params = sum(p.numel() for p in linear_affector_module.parameters())
-    # key_head: (EMBED+1)*NUM_KEYS
-    # mouse_dx mean+logstd: 2*(EMBED+1)*1
-    # mouse_dy mean+logstd: 2*(EMBED+1)*1
-    # mouse_button_head: (EMBED+1)*3
-    # scroll mean+logstd: 2*(EMBED+1)*1
-    # focus means+logstds: 2*(EMBED+1)*2
-    expected = (
-        (EMBED_DIM + 1) * NUM_KEYS
-        + 2 * (EMBED_DIM + 1) * 1
-        + 2 * (EMBED_DIM + 1) * 1
-        + (EMBED_DIM + 1) * 3
-        + 2 * (EMBED_DIM + 1) * 1
-        + 2 * (EMBED_DIM + 1) * 2
-    )
-    assert num_params == expected
+def test_linear_affector_params(linear_affector_param_count):
+    assert linear_affector_param_count == EXPECTED_PARAMS
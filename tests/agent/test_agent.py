@@ -8,13 +8,35 @@ from mineagent.client.protocol import NUM_KEYS
 
 @pytest.fixture
 def agent_v1_module():
+    # Function-scoped: `act` updates the agent's memory and focus state
     return AgentV1(
         AgentConfig(ppo=PPOConfig(), icm=ICMConfig(), td=TDConfig()),
     )
 
 
-def test_agent_v1_act_single(agent_v1_module: AgentV1):
-    input_tensor = torch.randn((1, 3, 160, 256))
+@pytest.fixture
+def agent_v1_param_count(agent_v1_module: AgentV1) -> int:
+    modules = [
+        agent_v1_module.vision,
+        agent_v1_module.affector,
+        agent_v1_module.critic,
+        agent_v1_module.inverse_dynamics,
+        agent_v1_module.forward_dynamics,
+    ]
+    return sum(sum(p.numel() for p in m.parameters()) for m in modules)
+
+
+@pytest.mark.parametrize(
+    "image_size",
+    [
+        (136, 136),  # smallest size the peripheral convolutions accept
+        pytest.param((160, 256), marks=pytest.mark.slow),
+    ],
+)
+def test_agent_v1_act_single(
+    agent_v1_module: AgentV1, image_size: tuple[int, int], rng: torch.Generator
+):
+    input_tensor = torch.randn((1, 3, *image_size), generator=rng)
 
     action = agent_v1_module.act(input_tensor)
 
@@ -44,13 +66,5 @@ def test_act_stores_extrinsic_reward_from_previous_step() -> None:
     assert agent.memory.rewards_buffer[1] == 7.5
 
 
-def test_agent_v1_params(agent_v1_module: AgentV1):
-    modules = [
-        agent_v1_module.vision,
-        agent_v1_module.affector,
-        agent_v1_module.critic,
-        agent_v1_module.inverse_dynamics,
-        agent_v1_module.forward_dynamics,
-    ]
-    num_params = sum(sum(p.numel() for p in m.parameters()) for m in modules)
-    assert num_params > 0
+def test_agent_v1_params(agent_v1_param_count: int):
+    assert agent_v1_param_count > 0
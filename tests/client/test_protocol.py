@@ -3,7 +3,16 @@ import struct
 import numpy as np
 import pytest
 
-from mineagent.client.protocol import GLFW, RawInput, parse_observation
+from mineagent.client.protocol import (
+    GLFW,
+    KEY_TO_INDEX,
+    NUM_KEYS,
+    RawInput,
+    action_to_raw_input,
+    pack_mouse_buttons,
+    parse_observation,
+    raw_input_to_action,
+)
 
 
 # --- to_bytes serialization ---
@@ -274,3 +283,46 @@ def test_parse_observation_default_frame_shape():
     obs = parse_observation(header, frame_data)
 
     assert obs.frame.shape == (240, 320, 3)
+
+
+# --- action space conversion ---
+
+
+def test_action_to_raw_input():
+    keys = np.zeros(NUM_KEYS, dtype=np.int8)
+    keys[KEY_TO_INDEX[GLFW.KEY_W]] = 1
+    keys[KEY_TO_INDEX[GLFW.KEY_SPACE]] = 1
+    action = {
+        "keys": keys,
+        "mouse_dx": np.array(5.0, dtype=np.float32),
+        "mouse_dy": np.array(-2.0, dtype=np.float32),
+        "mouse_buttons": np.array([1, 0, 1], dtype=np.int8),
+        "scroll_delta": np.array(1.5, dtype=np.float32),
+    }
+
+    raw = action_to_raw_input(action)
+
+    assert raw.key_codes == [GLFW.KEY_W, GLFW.KEY_SPACE]
+    assert raw.mouse_dx == 5.0
+    assert raw.mouse_dy == -2.0
+    assert raw.mouse_buttons == 0b101
+    assert raw.scroll_delta == 1.5
+
+
+def test_raw_input_action_round_trip():
+    raw = RawInput(
+        key_codes=[GLFW.KEY_A, GLFW.KEY_F3], mouse_buttons=0b110, mouse_dx=1.0
+    )
+
+    action = raw_input_to_action(raw)
+
+    np.testing.assert_array_equal(action["mouse_buttons"], [0, 1, 1])
+    assert action_to_raw_input(action) == raw
+
+
+def test_pack_mouse_buttons_batch():
+    buttons = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 1], [1, 1, 1]], dtype=np.int8)
+
+    packed = pack_mouse_buttons(buttons)
+
+    np.testing.assert_array_equal(packed, [0b000, 0b001, 0b110, 0b111])
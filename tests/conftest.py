@@ -0,0 +1,37 @@
+import pytest
+import torch
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--detect-anomaly",
+        action="store_true",
+        default=False,
+        help="Run every test with torch autograd anomaly detection enabled",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _torch_runtime():
+    """Tests use tiny tensors, so a single thread avoids thread-pool spin-up."""
+    torch.set_num_threads(1)
+    torch.set_num_interop_threads(1)
+    torch.manual_seed(42)
+    yield
+
+
+@pytest.fixture(scope="session")
+def rng() -> torch.Generator:
+    """Shared CPU generator for random test inputs."""
+    generator = torch.Generator(device="cpu")
+    generator.manual_seed(0)
+    return generator
+
+
+@pytest.fixture(autouse=True)
+def _anomaly_mode(request: pytest.FixtureRequest):
+    """Anomaly detection is slow, so it is opt-in via --detect-anomaly."""
+    with torch.autograd.set_detect_anomaly(
+        request.config.getoption("--detect-anomaly")
+    ):
+        yield
@@ -11,7 +11,7 @@ FOCUS_DIM = 2
 EMBED_DIM = AgentV1.EMBED_DIM
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def icm_module() -> ICM:
     agent = AgentV1(
         AgentConfig(
@@ -26,19 +26,24 @@ def icm_module() -> ICM:
 
 
 def test_icm_update(icm_module: ICM) -> None:
-    torch.autograd.anomaly_mode.set_detect_anomaly(True)
-
     buffer_size = 6
     trajectory = TrajectoryBuffer(max_buffer_size=buffer_size)
-    for _ in range(buffer_size):
-        trajectory.store(
-            torch.zeros((EMBED_DIM,), dtype=torch.float),
-            torch.zeros((ENV_ACTION_DIM,), dtype=torch.float),
-            0.0,
-            0.0,
-            0.0,
-            torch.ones((ENV_ACTION_DIM,), dtype=torch.float),
-            focus=torch.zeros((FOCUS_DIM,), dtype=torch.float),
-            focus_logp=torch.ones((FOCUS_DIM,), dtype=torch.float),
-        )
+    with torch.inference_mode():
+        # The buffer copies what it stores, so every step can share the same fill tensors
+        features = torch.zeros((EMBED_DIM,), dtype=torch.float)
+        action = torch.zeros((ENV_ACTION_DIM,), dtype=torch.float)
+        log_prob = torch.ones((ENV_ACTION_DIM,), dtype=torch.float)
+        focus = torch.zeros((FOCUS_DIM,), dtype=torch.float)
+        focus_logp = torch.ones((FOCUS_DIM,), dtype=torch.float)
+        for _ in range(buffer_size):
+            trajectory.store(
+                features,
+                action,
+                0.0,
+                0.0,
+                0.0,
+                log_prob,
+                focus=focus,
+                focus_logp=focus_logp,
+            )
     icm_module.update(trajectory)
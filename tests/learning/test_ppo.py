@@ -13,7 +13,7 @@ FOCUS_DIM = 2
 EMBED_DIM = AgentV1.EMBED_DIM
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def ppo_module() -> PPO:
     agent = AgentV1(
         AgentConfig(
@@ -26,21 +26,26 @@ def ppo_module() -> PPO:
 
 
 def test_ppo_update(ppo_module: PPO) -> None:
-    torch.autograd.anomaly_mode.set_detect_anomaly(True)
-
     buffer_size = 3
     trajectory = TrajectoryBuffer(max_buffer_size=buffer_size)
-    for _ in range(buffer_size):
-        trajectory.store(
-            torch.zeros((EMBED_DIM,), dtype=torch.float),
-            torch.zeros((ENV_ACTION_DIM,), dtype=torch.float),
-            0.0,
-            0.0,
-            0.0,
-            torch.ones((ENV_ACTION_DIM,), dtype=torch.float),
-            focus=torch.zeros((FOCUS_DIM,), dtype=torch.float),
-            focus_logp=torch.ones((FOCUS_DIM,), dtype=torch.float),
-        )
+    with torch.inference_mode():
+        # The buffer copies what it stores, so every step can share the same fill tensors
+        features = torch.zeros((EMBED_DIM,), dtype=torch.float)
+        action = torch.zeros((ENV_ACTION_DIM,), dtype=torch.float)
+        log_prob = torch.ones((ENV_ACTION_DIM,), dtype=torch.float)
+        focus = torch.zeros((FOCUS_DIM,), dtype=torch.float)
+        focus_logp = torch.ones((FOCUS_DIM,), dtype=torch.float)
+        for _ in range(buffer_size):
+            trajectory.store(
+                features,
+                action,
+                0.0,
+                0.0,
+                0.0,
+                log_prob,
+                focus=focus,
+                focus_logp=focus_logp,
+            )
     ppo_module.update(trajectory)
 
 
@@ -67,16 +72,21 @@ def test_ppo_finalize_weighted_rewards() -> None:
     trajectory = TrajectoryBuffer(max_buffer_size=buffer_size)
     env_r = [0.0, 4.0, 6.0]
     int_r = [0.0, 2.0, 4.0]
+    features = torch.zeros((EMBED_DIM,), dtype=torch.float)
+    action = torch.zeros((ENV_ACTION_DIM,), dtype=torch.float)
+    log_prob = torch.ones((ENV_ACTION_DIM,), dtype=torch.float)
+    focus = torch.zeros((FOCUS_DIM,), dtype=torch.float)
+    focus_logp = torch.ones((FOCUS_DIM,), dtype=torch.float)
     for i in range(buffer_size):
         trajectory.store(
-            torch.zeros((EMBED_DIM,), dtype=torch.float),
-            torch.zeros((ENV_ACTION_DIM,), dtype=torch.float),
+            features,
+            action,
             env_r[i],
             int_r[i],
             0.0,
-            torch.ones((ENV_ACTION_DIM,), dtype=torch.float),
-            focus=torch.zeros((FOCUS_DIM,), dtype=torch.float),
-            focus_logp=torch.ones((FOCUS_DIM,), dtype=torch.float),
+            log_prob,
+            focus=focus,
+            focus_logp=focus_logp,
         )
 
     weighted = lam_ext * np.array(env_r[1:]) + lam_icm * np.array(int_r[1:])
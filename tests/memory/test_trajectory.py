@@ -23,16 +23,12 @@ def test_trajectory(trajectory: TrajectoryBuffer):
     # Store first, known observation
     trajectory.store(obs, action, reward, intrinsic_reward, value, log_prob)
 
-    # Fill up buffer
+    # Fill up buffer, reusing the same input tensors for every step
+    zero_obs = torch.zeros((64,), dtype=torch.float)
+    zero_action = torch.zeros((10,), dtype=torch.int)
+    one_log_prob = torch.ones((10,), dtype=torch.float)
     for _ in range(1, MAX_BUFFER_SIZE):
-        trajectory.store(
-            torch.zeros((64,), dtype=torch.float),
-            torch.zeros((10,), dtype=torch.int),
-            0.0,
-            0.0,
-            0.0,
-            torch.ones((10,), dtype=torch.float),
-        )
+        trajectory.store(zero_obs, zero_action, 0.0, 0.0, 0.0, one_log_prob)
 
     assert torch.equal(trajectory.features_buffer[0], obs)
     assert torch.equal(trajectory.actions_buffer[0], action)
@@ -41,19 +37,100 @@ def test_trajectory(trajectory: TrajectoryBuffer):
     assert trajectory.values_buffer[0] == value
     assert torch.equal(trajectory.log_probs_buffer[0], log_prob)
 
+    # Stored items are copies, so mutating a reused input leaves the buffer untouched
+    zero_obs.fill_(5.0)
+    assert trajectory.features_buffer[1].abs().max().item() == 0.0
+    zero_obs.zero_()
+
     # Store an additional one, which should pop the first one off
-    trajectory.store(
-        torch.zeros((64,), dtype=torch.float),
-        torch.zeros((10,), dtype=torch.int),
-        0.0,
-        0.0,
-        0.0,
-        torch.ones((10,), dtype=torch.float),
-    )
+    trajectory.store(zero_obs, zero_action, 0.0, 0.0, 0.0, one_log_prob)
 
-    assert not torch.equal(trajectory.features_buffer[0], obs)
-    assert not torch.equal(trajectory.actions_buffer[0], action)
+    # The oldest item is now one of the fill items
+    assert trajectory.features_buffer[0].abs().max().item() == 0.0
+    assert trajectory.actions_buffer[0].abs().max().item() == 0.0
     assert trajectory.rewards_buffer[0] != reward
     assert trajectory.intrinsic_rewards_buffer[0] != intrinsic_reward
     assert trajectory.values_buffer[0] != value
-    assert not torch.equal(trajectory.log_probs_buffer[0], log_prob)
+    assert trajectory.log_probs_buffer[0].eq(1.0).all()
+
+
+def test_trajectory_to_device(trajectory: TrajectoryBuffer):
+    for step in range(3):
+        trajectory.store(
+            torch.full((64,), float(step)),
+            torch.zeros((10,)),
+            float(step),
+            0.0,
+            0.0,
+            torch.zeros((10,)),
+        )
+
+    fields = trajectory.to_device("cpu")
+
+    assert fields["features_buffer"].shape == (3, 64)
+    assert torch.equal(fields["rewards_buffer"], torch.tensor([0.0, 1.0, 2.0]))
+    assert fields["focus_buffer"].numel() == 0
+
+
+def test_trajectory_store_batch(trajectory: TrajectoryBuffer):
+    # Partially fill so the second batch wraps around the end of the ring
+    k = 4
+    for start in (0, k, 2 * k):
+        steps = torch.arange(start, start + k, dtype=torch.float)
+        trajectory.store_batch(
+            steps.unsqueeze(1).expand(k, 64),
+            torch.zeros((k, 10)),
+            steps,
+            2 * steps,
+            3 * steps,
+            torch.zeros((k, 10)),
+        )
+
+    expected = torch.arange(3 * k - MAX_BUFFER_SIZE, 3 * k, dtype=torch.float)
+    assert len(trajectory) == MAX_BUFFER_SIZE
+    assert torch.equal(trajectory.features_buffer[:, 0], expected)
+    assert torch.equal(trajectory.rewards_buffer, expected)
+    assert torch.equal(trajectory.intrinsic_rewards_buffer, 2 * expected)
+    assert torch.equal(trajectory.values_buffer, 3 * expected)
+
+
+def test_trajectory_store_in_inference_mode(trajectory: TrajectoryBuffer):
+    # Filling the buffer during rollouts must not turn its storage into inference tensors
+    with torch.inference_mode():
+        for step in range(3):
+            trajectory.store(
+                torch.full((64,), float(step)),
+                torch.zeros((10,)),
+                float(step),
+                0.0,
+                0.0,
+                torch.zeros((10,)),
+            )
+
+    assert not trajectory.features_buffer.is_inference()
+    assert not trajectory.rewards_buffer.is_inference()
+    linear = torch.nn.Linear(64, 1)
+    linear(trajectory.features_buffer).sum().backward()
+    assert linear.weight.grad is not None
+
+
+def test_trajectory_focus_every_store(trajectory: TrajectoryBuffer):
+    features, action, log_prob = (
+        torch.zeros((64,)),
+        torch.zeros((10,)),
+        torch.zeros((10,)),
+    )
+    focus, focus_logp = torch.zeros((2,)), torch.zeros((2,))
+    trajectory.store(features, action, 0.0, 0.0, 0.0, log_prob, focus, focus_logp)
+
+    # A store without focus would leave a slot the focus fields never wrote
+    with pytest.raises(ValueError):
+        trajectory.store(features, action, 0.0, 0.0, 0.0, log_prob)
+    assert len(trajectory) == 1
+
+    # Nor can focus start partway through a trajectory stored without it
+    unfocused = TrajectoryBuffer(max_buffer_size=MAX_BUFFER_SIZE)
+    unfocused.store(features, action, 0.0, 0.0, 0.0, log_prob)
+    with pytest.raises(ValueError):
+        unfocused.store(features, action, 0.0, 0.0, 0.0, log_prob, focus, focus_logp)
+    assert unfocused.focus_buffer.numel() == 0
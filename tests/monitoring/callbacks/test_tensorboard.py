@@ -2,11 +2,15 @@ import pytest
 import torch
 import os
 import shutil
+import threading
 from datetime import datetime
 
+from torchvision.utils import make_grid
+
 from mineagent.monitoring.callbacks.tensorboard import TensorboardWriter
 from mineagent.monitoring.event import (
     Action,
+    BatchedAction,
     Start,
     Stop,
     EnvStep,
@@ -92,22 +96,23 @@ def test_add_action(tensorboard_writer, mocker):
 
     # Add the action event
     tensorboard_writer.add_action(action_event)
+    tensorboard_writer.flush()
 
     # Verify the step counter was initialized and incremented
     assert tensorboard_writer.step_counter["action"] == 1
 
     # Verify histogram calls
-    add_histogram_mock.assert_any_call(
-        "Action/action", action_event.action, global_step=0
-    )
-    add_histogram_mock.assert_any_call(
-        "Action/logp_action", action_event.logp_action, global_step=0
-    )
-    add_histogram_mock.assert_any_call(
-        "Action/value", action_event.value, global_step=0
+    calls = add_histogram_mock.call_args_list
+    _verify_tensor_call(calls, "Action/action", action_event.action, global_step=0)
+    _verify_tensor_call(
+        calls, "Action/logp_action", action_event.logp_action, global_step=0
     )
-    add_histogram_mock.assert_any_call(
-        "Action/distribution", action_event.action_distribution, global_step=0
+    _verify_tensor_call(calls, "Action/value", action_event.value, global_step=0)
+    _verify_tensor_call(
+        calls,
+        "Action/distribution",
+        action_event.action_distribution,
+        global_step=0,
     )
 
     # Verify scalar call
@@ -124,6 +129,44 @@ def test_add_action(tensorboard_writer, mocker):
     )
 
 
+def test_add_batched_action(tensorboard_writer, mocker):
+    """Test adding BatchedAction event to TensorboardWriter."""
+    add_histogram_mock = mocker.patch.object(tensorboard_writer.writer, "add_histogram")
+    add_scalar_mock = mocker.patch.object(tensorboard_writer.writer, "add_scalar")
+    try_log_mock = mocker.patch.object(tensorboard_writer, "_try_log_as_image")
+
+    batch = 4
+    action_event = BatchedAction(
+        timestamp=datetime.now(),
+        visual_features=torch.randn(batch, 3, 32, 32),
+        action_distribution=torch.softmax(torch.randn(batch, 5), dim=-1),
+        action=torch.tensor([2, 0, 1, 4]),
+        logp_action=torch.randn(batch),
+        value=torch.randn(batch),
+        region_of_interest=torch.zeros(batch, 3, 4, 4),
+        intrinsic_reward=torch.tensor([0.1, 0.2, 0.3, 0.4]),
+    )
+
+    tensorboard_writer.add_action(action_event)
+    tensorboard_writer.flush()
+
+    # The whole batch is logged at once and the step advances by the batch size
+    assert tensorboard_writer.step_counter["action"] == batch
+    _verify_tensor_call(
+        add_histogram_mock.call_args_list,
+        "Action/action",
+        action_event.action,
+        global_step=0,
+    )
+    (name, intrinsic_reward), kwargs = add_scalar_mock.call_args
+    assert name == "Action/intrinsic_reward"
+    assert torch.isclose(intrinsic_reward, torch.tensor(0.25))
+    assert kwargs == {"global_step": 0}
+    try_log_mock.assert_any_call(
+        "Action/visual_features", action_event.visual_features, 0
+    )
+
+
 def test_add_env_step(tensorboard_writer, mocker):
     """Test adding EnvStep event to TensorboardWriter."""
     add_scalar_mock = mocker.patch.object(tensorboard_writer.writer, "add_scalar")
@@ -141,6 +184,7 @@ def test_add_env_step(tensorboard_writer, mocker):
 
     # Add the env step event
     tensorboard_writer.add_env_step(env_step_event)
+    tensorboard_writer.flush()
 
     # Verify add_scalar call
     add_scalar_mock.assert_called_once_with(
@@ -148,8 +192,12 @@ def test_add_env_step(tensorboard_writer, mocker):
     )
 
     # Verify add_histogram call
-    add_histogram_mock.assert_called_once_with(
-        "EnvStep/action", env_step_event.action, global_step=None
+    add_histogram_mock.assert_called_once()
+    _verify_tensor_call(
+        add_histogram_mock.call_args_list,
+        "EnvStep/action",
+        env_step_event.action,
+        global_step=None,
     )
 
     # Verify add_image calls using call_args_list
@@ -179,6 +227,7 @@ def test_add_env_reset(tensorboard_writer, mocker):
 
     # Add the env reset event
     tensorboard_writer.add_env_reset(env_reset_event)
+    tensorboard_writer.flush()
 
     # Verify call
     _verify_tensor_call(
@@ -270,6 +319,7 @@ def test_add_start_stop(tensorboard_writer, mocker):
     # Add the events
     tensorboard_writer.add_start(start_event)
     tensorboard_writer.add_stop(stop_event)
+    tensorboard_writer.flush()
 
     # Verify calls
     add_text_mock.assert_any_call("Start/event", "Simulation started", global_step=None)
@@ -286,15 +336,104 @@ def test_log_tensor_stats(tensorboard_writer, mocker):
 
     # Call the method
     tensorboard_writer._log_tensor_stats("test/tensor", test_tensor, 0)
+    tensorboard_writer.flush()
 
     # Verify calls
     _verify_tensor_call(
         add_histogram_mock.call_args_list, "test/tensor/hist", test_tensor, 0
     )
-    add_scalar_mock.assert_any_call("test/tensor/mean", test_tensor.float().mean(), 0)
-    add_scalar_mock.assert_any_call("test/tensor/std", test_tensor.float().std(), 0)
-    add_scalar_mock.assert_any_call("test/tensor/min", test_tensor.float().min(), 0)
-    add_scalar_mock.assert_any_call("test/tensor/max", test_tensor.float().max(), 0)
+    std, mean = torch.std_mean(test_tensor)
+    minimum, maximum = torch.aminmax(test_tensor)
+    add_scalar_mock.assert_any_call("test/tensor/mean", mean, 0)
+    add_scalar_mock.assert_any_call("test/tensor/std", std, 0)
+    add_scalar_mock.assert_any_call("test/tensor/min", minimum, 0)
+    add_scalar_mock.assert_any_call("test/tensor/max", maximum, 0)
+
+
+def test_log_tensor_stats_half_precision(tensorboard_writer, mocker):
+    """Reduced-precision tensors are cast to float once and reduced in float32."""
+    mocker.patch.object(tensorboard_writer.writer, "add_histogram")
+    add_scalar_mock = mocker.patch.object(tensorboard_writer.writer, "add_scalar")
+
+    test_tensor = torch.tensor([1.0, 2.0, 3.0, 4.0, 5.0], dtype=torch.half)
+    tensorboard_writer._log_tensor_stats("test/half", test_tensor, 0)
+    tensorboard_writer.flush()
+
+    scalars = {call.args[0]: call.args[1] for call in add_scalar_mock.call_args_list}
+    std, mean = torch.std_mean(test_tensor.float())
+    assert scalars["test/half/mean"].dtype == torch.float32
+    assert scalars["test/half/mean"] == mean
+    assert scalars["test/half/std"] == std
+    assert scalars["test/half/min"] == 1.0
+    assert scalars["test/half/max"] == 5.0
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+def test_log_tensor_stats_cuda(tensorboard_writer, mocker):
+    """CUDA tensors are reduced on the device and staged into pinned host memory."""
+    add_histogram_mock = mocker.patch.object(tensorboard_writer.writer, "add_histogram")
+    add_scalar_mock = mocker.patch.object(tensorboard_writer.writer, "add_scalar")
+    add_image_mock = mocker.patch.object(tensorboard_writer.writer, "add_image")
+
+    test_tensor = torch.arange(16, dtype=torch.float, device="cuda")
+    tensorboard_writer._log_tensor_stats("test/cuda", test_tensor, 0)
+    tensorboard_writer.flush()
+
+    # The histogram and every statistic went through the pinned staging copy
+    (_, histogram, _), _ = add_histogram_mock.call_args
+    assert histogram.is_pinned()
+    assert torch.equal(histogram, test_tensor.cpu())
+    scalars = {call.args[0]: call.args[1] for call in add_scalar_mock.call_args_list}
+    assert all(scalar.is_pinned() for scalar in scalars.values())
+    assert scalars["test/cuda/max"] == 15.0
+
+    # Image grids are built on the device and staged the same way
+    tensorboard_writer._try_log_as_image(
+        "test/cuda_image", torch.rand(4, 3, 8, 8, device="cuda"), 0
+    )
+    tensorboard_writer.flush()
+    (_, grid, _), _ = add_image_mock.call_args
+    assert grid.is_pinned()
+
+
+def test_log_tensor_stats_subsamples_histogram(tensorboard_writer, mocker):
+    """Large tensors are sub-sampled before being logged as a histogram."""
+    add_histogram_mock = mocker.patch.object(tensorboard_writer.writer, "add_histogram")
+    mocker.patch.object(tensorboard_writer.writer, "add_scalar")
+    max_elements = tensorboard_writer._config.histogram_max_elements
+
+    test_tensor = torch.arange(3 * max_elements + 1, dtype=torch.float)
+    tensorboard_writer._log_tensor_stats("test/large", test_tensor, 0)
+    tensorboard_writer.flush()
+
+    (name, histogram, step), _ = add_histogram_mock.call_args
+    assert name == "test/large/hist"
+    assert step == 0
+    assert 0 < histogram.numel() <= max_elements
+    # Deterministic strided sample of the input, starting at its first element
+    stride = -(-test_tensor.numel() // max_elements)
+    assert torch.equal(histogram, test_tensor[::stride])
+
+
+def test_log_tensor_stats_snapshots_input(tensorboard_writer, mocker):
+    """In-place changes to the input after logging do not reach the written values."""
+    add_histogram_mock = mocker.patch.object(tensorboard_writer.writer, "add_histogram")
+    add_scalar_mock = mocker.patch.object(tensorboard_writer.writer, "add_scalar")
+    # Hold the worker so the call is still queued when the input is overwritten
+    release = threading.Event()
+    tensorboard_writer._queue.put([("flush", (), {}, None)])
+    mocker.patch.object(tensorboard_writer.writer, "flush", side_effect=release.wait)
+
+    test_tensor = torch.zeros(4, 64)
+    tensorboard_writer._log_tensor_stats("test/reused", test_tensor, 0)
+    test_tensor.fill_(7.0)
+    release.set()
+    tensorboard_writer.flush()
+
+    (_, histogram, _), _ = add_histogram_mock.call_args
+    assert torch.equal(histogram, torch.zeros(4, 64))
+    scalars = {call.args[0]: call.args[1] for call in add_scalar_mock.call_args_list}
+    assert scalars["test/reused/max"] == 0.0
 
 
 def test_try_log_as_image(tensorboard_writer, mocker):
@@ -304,6 +443,7 @@ def test_try_log_as_image(tensorboard_writer, mocker):
     # Test 2D tensor (grayscale image)
     tensor_2d = torch.zeros(28, 28)
     tensorboard_writer._try_log_as_image("test/2d", tensor_2d, 0)
+    tensorboard_writer.flush()
     _verify_tensor_call(
         add_image_mock.call_args_list,
         "test/2d",
@@ -315,6 +455,7 @@ def test_try_log_as_image(tensorboard_writer, mocker):
     # Test 3D tensor with channels first (CHW)
     tensor_3d_chw = torch.zeros(3, 32, 32)
     tensorboard_writer._try_log_as_image("test/3d_chw", tensor_3d_chw, 0)
+    tensorboard_writer.flush()
     _verify_tensor_call(
         add_image_mock.call_args_list,
         "test/3d_chw",
@@ -326,6 +467,7 @@ def test_try_log_as_image(tensorboard_writer, mocker):
     # Test 3D tensor with batch dimension (batch of grayscale)
     tensor_3d_batch = torch.zeros(10, 28, 28)
     tensorboard_writer._try_log_as_image("test/3d_batch", tensor_3d_batch, 0)
+    tensorboard_writer.flush()
     expected_3d_grid = tensorboard_writer._make_grid(tensor_3d_batch.unsqueeze(1))
     _verify_tensor_call(
         add_image_mock.call_args_list,
@@ -338,6 +480,7 @@ def test_try_log_as_image(tensorboard_writer, mocker):
     # Test 4D tensor (batch of RGB images)
     tensor_4d = torch.zeros(5, 3, 32, 32)
     tensorboard_writer._try_log_as_image("test/4d", tensor_4d, 0)
+    tensorboard_writer.flush()
     expected_4d_grid = tensorboard_writer._make_grid(tensor_4d)
     _verify_tensor_call(
         add_image_mock.call_args_list,
@@ -348,28 +491,6 @@ def test_try_log_as_image(tensorboard_writer, mocker):
     )
 
 
-def test_normalize_for_visualization():
-    """Test the _normalize_for_visualization method."""
-    config = TensorboardConfig(log_dir="test_logs")
-    writer = TensorboardWriter(config)
-
-    # Test with a tensor that needs normalization
-    tensor = torch.tensor([1.0, 2.0, 3.0, 4.0, 5.0])
-    normalized = writer._normalize_for_visualization(tensor)
-    assert normalized.min().item() == 0.0
-    assert normalized.max().item() == 1.0
-
-    # Test with a constant tensor (should handle division by zero case)
-    constant_tensor = torch.ones(5) * 3.0
-    normalized = writer._normalize_for_visualization(constant_tensor)
-    assert torch.all(normalized == constant_tensor).item()
-
-    # Cleanup
-    writer.close()
-    if os.path.exists("test_logs"):
-        shutil.rmtree("test_logs")
-
-
 def test_make_grid():
     """Test the _make_grid method."""
     config = TensorboardConfig(log_dir="test_logs")
@@ -388,12 +509,70 @@ def test_make_grid():
     grid = writer._make_grid(batch, max_images=5)
     # Should only use 5 images
 
+    # Matches gridding the normalized batch, with black padding
+    minimum, maximum = torch.aminmax(batch[:5])
+    expected = make_grid((batch[:5] - minimum) / (maximum - minimum))
+    assert torch.allclose(grid, expected)
+
+    # A single image is normalized without touching the caller's tensor
+    image = torch.tensor([1.0, 2.0, 3.0, 5.0]).reshape(1, 1, 2, 2).expand(1, 3, 2, 2)
+    image = image.contiguous()
+    original = image.clone()
+    grid = writer._make_grid(image)
+    assert torch.equal(image, original)
+    assert grid.min().item() == 0.0
+    assert grid.max().item() == 1.0
+
+    # A constant batch is left as is rather than divided by zero
+    constant = torch.full((2, 3, 4, 4), 3.0)
+    assert torch.all(writer._make_grid(constant)[:, 2:6, 2:6] == 3.0).item()
+
     # Cleanup
     writer.close()
     if os.path.exists("test_logs"):
         shutil.rmtree("test_logs")
 
 
+def test_nested_batches(tensorboard_writer, mocker):
+    """A handler run inside another batch does not drop the calls already collected."""
+    add_text_mock = mocker.patch.object(tensorboard_writer.writer, "add_text")
+    add_image_mock = mocker.patch.object(tensorboard_writer.writer, "add_image")
+
+    with tensorboard_writer._step_batch():
+        tensorboard_writer.add_start(Start(timestamp=datetime.now()))
+        tensorboard_writer.add_env_reset(
+            EnvReset(timestamp=datetime.now(), observation=torch.zeros(3, 4, 4))
+        )
+        tensorboard_writer.add_stop(Stop(timestamp=datetime.now(), total_return=0.0))
+    tensorboard_writer.flush()
+
+    assert add_text_mock.call_count == 2
+    add_image_mock.assert_called_once()
+
+
+def test_batches_per_thread(tensorboard_writer, mocker):
+    """Events handled on different threads are batched independently."""
+    add_text_mock = mocker.patch.object(tensorboard_writer.writer, "add_text")
+    inside = threading.Barrier(2)
+
+    def handle() -> None:
+        with tensorboard_writer._step_batch():
+            tensorboard_writer.add_start(Start(timestamp=datetime.now()))
+            inside.wait()
+            tensorboard_writer.add_stop(
+                Stop(timestamp=datetime.now(), total_return=0.0)
+            )
+
+    threads = [threading.Thread(target=handle) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    tensorboard_writer.flush()
+
+    assert add_text_mock.call_count == 4
+
+
 def test_close(tensorboard_writer, mocker):
     """Test the close method."""
     close_mock = mocker.patch.object(tensorboard_writer.writer, "close")
@@ -401,3 +580,18 @@ def test_close(tensorboard_writer, mocker):
     tensorboard_writer.close()
 
     close_mock.assert_called_once()
+
+
+def test_enqueue_after_close(tensorboard_writer, mocker):
+    """Calls made after closing are dropped instead of filling the queue."""
+    add_text_mock = mocker.patch.object(tensorboard_writer.writer, "add_text")
+    mocker.patch.object(tensorboard_writer.writer, "close")
+    tensorboard_writer.close()
+
+    tensorboard_writer.add_start(Start(timestamp=datetime.now()))
+    tensorboard_writer.add_env_reset(
+        EnvReset(timestamp=datetime.now(), observation=torch.zeros(3, 4, 4))
+    )
+
+    assert tensorboard_writer._queue.empty()
+    add_text_mock.assert_not_called()
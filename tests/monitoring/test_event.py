@@ -8,6 +8,7 @@ from mineagent.monitoring.event import (
     EnvStep,
     EnvReset,
     Action,
+    BatchedAction,
     ModuleForwardStart,
     ModuleForwardEnd,
 )
@@ -107,6 +108,40 @@ def test_action_event():
     assert event.intrinsic_reward == intrinsic_reward
 
 
+def test_batched_action_event():
+    """Test that BatchedAction event can be instantiated with batched fields."""
+    timestamp = datetime.now()
+    batch = 4
+    visual_features = torch.randn(batch, 10)
+    action_distribution = torch.softmax(torch.randn(batch, 5), dim=-1)
+    action = torch.tensor([2, 0, 1, 4])
+    logp_action = torch.randn(batch)
+    value = torch.randn(batch)
+    region_of_interest = torch.zeros(batch, 3, 4, 4)
+    intrinsic_reward = torch.rand(batch)
+
+    event = BatchedAction(
+        timestamp=timestamp,
+        visual_features=visual_features,
+        action_distribution=action_distribution,
+        action=action,
+        logp_action=logp_action,
+        value=value,
+        region_of_interest=region_of_interest,
+        intrinsic_reward=intrinsic_reward,
+    )
+
+    assert isinstance(event, Event)
+    assert event.timestamp == timestamp
+    assert torch.equal(event.visual_features, visual_features)
+    assert torch.equal(event.action_distribution, action_distribution)
+    assert torch.equal(event.action, action)
+    assert torch.equal(event.logp_action, logp_action)
+    assert torch.equal(event.value, value)
+    assert torch.equal(event.region_of_interest, region_of_interest)
+    assert torch.equal(event.intrinsic_reward, intrinsic_reward)
+
+
 def test_module_forward_start_event():
     """Test that ModuleForwardStart event can be instantiated."""
     timestamp = datetime.now()
@@ -96,6 +96,7 @@ def test_disable_enable(mocker):
 
     # Disable the event bus
     event_bus.disable()
+    assert event_bus.has_listeners(MockEvent) is False
 
     # Publish an event (should not trigger callback)
     test_event = MockEvent(42)
@@ -106,6 +107,7 @@ def test_disable_enable(mocker):
 
     # Enable the event bus
     event_bus.enable()
+    assert event_bus.has_listeners(MockEvent) is True
 
     # Publish an event again
     event_bus.publish(test_event)
@@ -114,6 +116,19 @@ def test_disable_enable(mocker):
     mock_callback.assert_called_once_with(test_event)
 
 
+def test_has_listeners(mocker):
+    """Test has_listeners reflects subscriptions and the global toggle."""
+    event_bus = EventBus()
+    assert event_bus.has_listeners(MockEvent) is False
+
+    event_bus.subscribe(MockEvent, mocker.Mock())
+    assert event_bus.has_listeners(MockEvent) is True
+    assert event_bus.has_listeners(AnotherMockEvent) is False
+
+    event_bus.disable()
+    assert event_bus.has_listeners(MockEvent) is False
+
+
 def test_subscribe_return_value(mocker):
     """Test that subscribe returns the callback function."""
     event_bus = EventBus()
@@ -36,6 +36,41 @@ def test_visual_perception_forward(visual_perception_module):
     assert output.shape[1] == 32 + 32
 
 
+def test_center_crop_is_view():
+    """The in-bounds ROI crop is a strided view of the frame, not a copy."""
+    input_tensor = torch.randn((2, 3, 160, 256))
+    cropped_input = center_crop(input_tensor, [32, 32])
+
+    top, left = (160 - 32) // 2, (256 - 32) // 2
+    offset = top * input_tensor.stride(2) + left * input_tensor.stride(3)
+    assert cropped_input.data_ptr() == (
+        input_tensor.data_ptr() + offset * input_tensor.element_size()
+    )
+    assert torch.equal(
+        cropped_input, input_tensor[:, :, top : top + 32, left : left + 32]
+    )
+
+
+def test_visual_perception_channels_last(visual_perception_module):
+    conv_outputs = []
+    handles = [
+        conv.register_forward_hook(lambda m, i, o: conv_outputs.append(o))
+        for conv in (
+            visual_perception_module.foveated_perception.conv1,
+            visual_perception_module.peripheral_perception.conv1,
+        )
+    ]
+    input_tensor = torch.randn((2, 3, 160, 256))
+
+    visual_perception_module(input_tensor, center_crop(input_tensor, [32, 32]))
+    for handle in handles:
+        handle.remove()
+
+    assert len(conv_outputs) == 2
+    for output in conv_outputs:
+        assert output.is_contiguous(memory_format=torch.channels_last)
+
+
 def test_visual_perception_params(visual_perception_module):
     num_params = sum(p.numel() for p in visual_perception_module.parameters())
     assert num_params == VISUAL_EXPECTED_PARAMS
@@ -19,6 +19,14 @@ def test_linear_critic_forward(linear_critic_module):
     assert out.shape == (32, 1)
 
 
+@pytest.mark.slow
+def test_linear_critic_compiled():
+    compiled_critic = LinearCritic.compiled(embed_dim=EMBED_DIM)
+    input_tensor = torch.randn((32, EMBED_DIM))
+    out = compiled_critic(input_tensor)
+    assert out.shape == (32, 1)
+
+
 def test_linear_critic_params(linear_critic_module):
     num_params = sum(p.numel() for p in linear_critic_module.parameters())
     assert num_params == LINEAR_CRITIC_EXPECTED_PARAMS
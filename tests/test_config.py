@@ -1,5 +1,6 @@
-from dataclasses import asdict
-from copy import deepcopy
+import os
+from dataclasses import FrozenInstanceError
+from pathlib import Path
 
 import pytest
 import yaml
@@ -15,19 +16,48 @@ from mineagent.config import (
     AgentConfig,
     Config,
     MonitoringConfig,
+    _value_parser,
 )
 from tests.helper import CONFIG_PATH
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
-def test_ppo_config():
-    """Test consistency between configuration and PPO algorithm"""
-    # Base template (expected values)
-    with open(CONFIG_PATH, "r") as fp:
-        config_dict = yaml.load(fp, yaml.Loader)
 
-    # Parsing
-    config = parse_config(CONFIG_PATH)
-    agent = AgentV1(config.agent)
+class FlatLoader(_SafeLoader):
+    """Safe loader resolving only the scalar types the flat template config uses."""
+
+
+# Keep merge keys so anchors still behave like the production loader
+_FLAT_TAGS = frozenset(
+    f"tag:yaml.org,2002:{name}" for name in ("bool", "int", "float", "null", "merge")
+)
+FlatLoader.yaml_implicit_resolvers = {
+    first: [resolver for resolver in resolvers if resolver[0] in _FLAT_TAGS]
+    for first, resolvers in _SafeLoader.yaml_implicit_resolvers.items()
+}
+
+
+@pytest.fixture(scope="module")
+def parsed_config() -> tuple[dict, Config]:
+    """Template config as raw YAML (expected values) and parsed, read once per module."""
+    config_dict = yaml.load(Path(CONFIG_PATH).read_bytes(), FlatLoader)
+    return config_dict, parse_config(CONFIG_PATH)
+
+
+@pytest.fixture(scope="module")
+def config_agent(parsed_config) -> AgentV1:
+    """Agent built from the template config, constructed once per module."""
+    _, config = parsed_config
+    return AgentV1(config.agent)
+
+
+def test_ppo_config(parsed_config, config_agent):
+    """Test consistency between configuration and PPO algorithm"""
+    config_dict, _ = parsed_config
+    agent = config_agent
 
     # Comparison
     assert (
@@ -57,13 +87,8 @@ def test_ppo_config():
     )
 
 
-def test_parse_config():
-    # Base template (expected values)
-    with open(CONFIG_PATH, "r") as fp:
-        config_dict = yaml.load(fp, yaml.Loader)
-
-    # Parsing
-    config = parse_config(CONFIG_PATH)
+def test_parse_config(parsed_config):
+    config_dict, config = parsed_config
 
     # Comparison
     assert (
@@ -93,6 +118,23 @@ def test_parse_config():
     )
 
 
+def test_parse_config_cached(tmp_path):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text("engine:\n  max_steps: 10\n")
+
+    config = parse_config(str(config_path))
+    # The parsed config is immutable, so repeated calls can share it
+    with pytest.raises(FrozenInstanceError):
+        config.engine.max_steps = 99  # type: ignore[misc]
+    assert parse_config(str(config_path)) is config
+
+    # Editing the file invalidates the cached parse
+    config_path.write_text("engine:\n  max_steps: 20\n")
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert parse_config(str(config_path)).engine.max_steps == 20
+
+
 def test_update_config():
     config = Config(
         engine=EngineConfig(),
@@ -105,17 +147,20 @@ def test_update_config():
     )
 
     # Other - empty list
-    before_change = deepcopy(config)
-    update_config(config, [])
+    before_change = config
+    config = update_config(config, [])
 
-    assert asdict(before_change) == asdict(config)
+    assert config == before_change
 
     # Valid update - replace values
     to_update = ["engine.image_size=[200,200]", "agent.ppo.clip_ratio=3.0"]
-    update_config(config, to_update)
+    config = update_config(config, to_update)
     assert config.engine.image_size == (200, 200)
     assert config.agent.ppo.clip_ratio == 3.0
-    assert asdict(before_change) != asdict(config)
+    assert config != before_change
+    # The original is left untouched and unchanged branches are shared
+    assert before_change.engine.image_size == EngineConfig().image_size
+    assert config.agent.icm is before_change.agent.icm
 
     # Invalid update - type mismatch
     to_update = ["engine.image_size=10"]
@@ -126,3 +171,66 @@ def test_update_config():
     to_update = ["Test1"]
     with pytest.raises(ValueError) as _:
         update_config(config, to_update)
+
+    # Invalid update - unknown nested key
+    to_update = ["agent.ppo.not_a_field=1.0"]
+    with pytest.raises(ValueError) as _:
+        update_config(config, to_update)
+
+    # Invalid update - unknown key after a malformed value is still a key error
+    with pytest.raises(ValueError, match="known configuration key"):
+        update_config(config, ["engine.max_steps=oops", "Test1"])
+
+    # Invalid update - every pair is checked before any is applied
+    with pytest.raises(ValueError) as _:
+        update_config(config, ["engine.max_steps=5", "engine.max_steps=oops"])
+
+    # Values are parsed as the annotated field type
+    config = update_config(
+        config,
+        [
+            "agent.ppo.actor_lr=1e-4",
+            "agent.ppo.clip_ratio=2",
+            "monitoring.enabled=false",
+        ],
+    )
+    assert config.agent.ppo.actor_lr == 1e-4
+    assert config.agent.ppo.clip_ratio == 2.0
+    assert config.monitoring.enabled is False
+    with pytest.raises(ValueError) as _:
+        update_config(config, ["engine.max_steps=1.5"])
+    with pytest.raises(ValueError) as _:
+        update_config(config, ["engine.image_size=[1,2,3]"])
+
+    # Valid update - field under an optional nested config
+    config = update_config(config, ["monitoring.tensorboard.log_dir=elsewhere"])
+    assert config.monitoring.tensorboard is not None
+    assert config.monitoring.tensorboard.log_dir == "elsewhere"
+
+
+def test_tuple_value_parser():
+    # Fixed-size tuples check the number of items
+    assert _value_parser(tuple[int, float])("[1, 2.5]") == (1, 2.5)
+    with pytest.raises(ValueError) as _:
+        _value_parser(tuple[int, int])("[1,2,3]")
+
+    # Variadic tuples accept any number of items of the one type
+    assert _value_parser(tuple[int, ...])("[1,2,3]") == (1, 2, 3)
+    assert _value_parser(tuple[int, ...])("[]") == ()
+    with pytest.raises(ValueError) as _:
+        _value_parser(tuple[int, ...])("[1,x]")
+
+
+def test_checked_value_parser():
+    # Types without a dedicated parser go through YAML and are checked against the hint
+    assert _value_parser(int | None)("3") == 3
+    assert _value_parser(int | None)("null") is None
+    assert _value_parser(float | None)("2") == 2.0
+    assert _value_parser(tuple[int, int] | None)("[1, 2]") == (1, 2)
+    assert _value_parser(list[int])("[1, 2]") == [1, 2]
+    with pytest.raises(ValueError) as _:
+        _value_parser(int | None)("abc")
+    with pytest.raises(ValueError) as _:
+        _value_parser(int | None)("true")
+    with pytest.raises(ValueError) as _:
+        _value_parser(str | None)("[1, 2]")
@@ -1,22 +1,34 @@
 import numpy as np
-import torch
+import pytest
 
 from mineagent.utils import discount_cumsum
 
+DISCOUNT_INPUT = np.array([1.0, 2.0, 3.0, 4.0], dtype=np.float32)
 
-def test_discount_cumsum():
-    discount = 1.0
-    input_tensor = torch.tensor([1.0, 2.0, 3.0, 4.0]).numpy()
-    expected_output = torch.tensor([10.0, 9.0, 7.0, 4.0]).numpy()
-    output = discount_cumsum(input_tensor, discount)
-    assert np.array_equal(output, expected_output)
 
-    discount = 0.5
-    expected_output = torch.tensor([3.25, 4.5, 5.0, 4.0]).numpy()
-    output = discount_cumsum(input_tensor, discount)
+@pytest.mark.parametrize(
+    "discount, expected_output",
+    [
+        (1.0, np.array([10.0, 9.0, 7.0, 4.0], dtype=np.float32)),
+        (0.5, np.array([3.25, 4.5, 5.0, 4.0], dtype=np.float32)),
+        (0.0, DISCOUNT_INPUT),
+    ],
+)
+def test_discount_cumsum(discount, expected_output):
+    output = discount_cumsum(DISCOUNT_INPUT, discount)
     assert np.array_equal(output, expected_output)
 
-    discount = 0.0
-    expected_output = torch.tensor([1.0, 2.0, 3.0, 4.0]).numpy()
-    output = discount_cumsum(input_tensor, discount)
-    assert np.array_equal(output, expected_output)
+
+@pytest.mark.parametrize("discount", [0.0, 0.5, 0.99, 1.0])
+def test_discount_cumsum_batched(discount):
+    # Three sequences along the last axis, accumulated in one call
+    input_array = np.arange(12, dtype=np.float64).reshape(3, 4)
+    output = discount_cumsum(input_array, discount, axis=-1)
+
+    assert output.shape == input_array.shape
+    assert output.dtype == np.float32
+    assert output.flags.c_contiguous
+    for row, expected_input in zip(output, input_array):
+        assert np.allclose(row, discount_cumsum(expected_input, discount))
+    # Time along the first axis matches accumulating each column
+    assert np.allclose(discount_cumsum(input_array.T, discount, axis=0), output.T)